@@ -18,17 +18,28 @@
 # Copyright (c) 2020 DecisionScients                                          #
 # =========================================================================== #
 # %%
+import contextlib
+import functools
 import os
 
 import numpy as np
 from pytest import fixture
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
 import random
 import string
 
 from datastudio.core.data import DataStoreFile, DataSourceFile
 from datastudio.core.data import DataSet, DataCollection
 from datastudio.core.file import File
-USECOLS = ["id", "host_id",
+try:
+    from joblib import Memory
+    _cache = Memory('.pytest_cache/io', mmap_mode='r', verbose=0).cache
+except ImportError:
+    _cache = functools.lru_cache(maxsize=None)
+USECOLS = ("id", "host_id",
             "host_response_rate",
             "host_total_listings_count",
             "host_response_time",
@@ -81,16 +92,68 @@ USECOLS = ["id", "host_id",
             "last_scraped",
             "calculated_host_listings_count_entire_homes",
             "calculated_host_listings_count_private_rooms",
-            "calculated_host_listings_count_shared_rooms",
-            "reviews_per_month"]
+            "calculated_host_listings_count_shared_rooms")
+
+DTYPES = {'room_type': 'category',
+          'bed_type': 'category',
+          'cancellation_policy': 'category',
+          'city': 'category',
+          'state': 'category',
+          'market': 'category',
+          'host_response_time': 'category',
+          'property_type': 'category',
+          'experiences_offered': 'category',
+          'host_is_superhost': 'category',
+          'instant_bookable': 'category',
+          'requires_license': 'category',
+          'host_has_profile_pic': 'category',
+          'host_identity_verified': 'category',
+          'is_business_travel_ready': 'category',
+          'accommodates': 'Int8',
+          'beds': 'Int8',
+          'bedrooms': 'Int8',
+          'bathrooms': 'Float32',
+          'guests_included': 'Int8',
+          'availability_30': 'Int8',
+          'minimum_nights': 'Int32',
+          'maximum_nights': 'Int32',
+          'number_of_reviews_ltm': 'Int16',
+          'review_scores_accuracy': 'Float32',
+          'review_scores_checkin': 'Float32',
+          'review_scores_cleanliness': 'Float32',
+          'review_scores_communication': 'Float32',
+          'review_scores_location': 'Float32',
+          'review_scores_rating': 'Float32',
+          'review_scores_value': 'Float32'}
+
+_ARRAY_CACHE = os.path.join('.pytest_cache', 'arrays')
+_PARQUET_CACHE = os.path.join('.pytest_cache', 'parquet')
+
+# Bump when the arrays built by get_numpy_arrays change, so that caches
+# built by earlier versions of the fixture are not reused.
+_ARRAY_VERSION = 2
 
 @fixture(scope="session")
 def get_numpy_arrays():
-    a = np.arange(0,100)
-    b = np.reshape(a, (25,4))
-    c = np.logspace(0,100)
-    d = np.reshape(c, (5,-1))
-    e = np.array([a,b,c,d])
+    """Returns arrays built on the first session and memory mapped thereafter.
+    
+    The arrays are saved as individual .npy files since members of an .npz
+    archive cannot be memory mapped. The cache directory is keyed on
+    _ARRAY_VERSION. The arrays are always loaded back from the cache, so
+    every session returns the same read-only memory mapped arrays.
+    """
+    directory = os.path.join(_ARRAY_CACHE, 'v{}'.format(_ARRAY_VERSION))
+    paths = [os.path.join(directory, n + '.npy') for n in 'abcd']
+    if not all(os.path.exists(path) for path in paths):
+        a = np.arange(0,100)
+        b = np.reshape(a, (25,4))
+        c = np.logspace(0,38, dtype=np.float32)
+        d = np.reshape(c, (5,-1))
+        os.makedirs(directory, exist_ok=True)
+        for path, array in zip(paths, (a, b, c, d)):
+            np.save(path, array)
+    a, b, c, d = (np.load(path, mmap_mode='r') for path in paths)
+    e = (a, b, c, d)
     return a, b, c, d, e
 
 @fixture(scope='session')
@@ -102,14 +165,65 @@ def get_text():
     tl = [t1, t2, t3]
     return t1, tl
 
+@_cache
+def _load(path, name, mtime, usecols, dtypes):
+    """Reads a listings file, preferring its Parquet copy when available.
+    
+    The Parquet copy is kept under .pytest_cache, not next to the source
+    file, and is rewritten when it is older than the source. Results are 
+    cached on disk across sessions. The mtime argument is part
+    of the cache key so that edits to the source file invalidate the cache.
+    """
+    f = File(path=path, name=name)
+    root = os.path.splitext(os.path.basename(path))[0]
+    parquet = os.path.join(_PARQUET_CACHE, root + '.parquet')
+    if os.path.exists(parquet) and mtime is not None and \
+        os.path.getmtime(parquet) >= mtime:
+        f = File(path=parquet, name=name)
+    elif mtime is not None:
+        if os.path.exists(parquet):
+            os.remove(parquet)
+        content = f.read()
+        if content is not None:
+            File(path=parquet, name=name).write(content)
+        if os.path.exists(parquet):
+            f = File(path=parquet, name=name)
+    return f.read(filter=usecols, dtype=dict(dtypes))
+
+def _read_listings(path, name):
+    """Reads a listings file through the session cache."""
+    mtime = os.path.getmtime(path) if os.path.exists(path) else None
+    return _load(path, name, mtime, USECOLS, tuple(sorted(DTYPES.items())))
+
+@contextlib.contextmanager
+def _arrow_pool():
+    """Backs pyarrow allocations in the block with one jemalloc pool.
+
+    Buffers freed between reads are reused rather than returned to the
+    system. The previous pool is restored when the block exits.
+    """
+    try:
+        pool = pa.jemalloc_memory_pool() if pa is not None else None
+    except NotImplementedError:
+        pool = None
+    if pool is None:
+        yield
+        return
+    previous = pa.default_memory_pool()
+    pa.set_memory_pool(pool)
+    try:
+        yield
+    finally:
+        pa.set_memory_pool(previous)
+        pool.release_unused()
+
 @fixture(scope='session')
 def get_dfs():
     nash = "./tests/test_data/test_file/nashville.csv"
     sf = "./tests/test_data/test_file/san_francisco.csv"
-    fn = File(path=nash, name="Nashville")
-    fsf = File(path=sf, name='San Francisco')
-    dfn = fn.read(filter=USECOLS)
-    dfsf = fsf.read(filter=USECOLS)
+    with _arrow_pool():
+        dfn = _read_listings(nash, "Nashville")
+        dfsf = _read_listings(sf, 'San Francisco')
     dfs = [dfn, dfsf]
     return dfs
 
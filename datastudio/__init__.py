@@ -17,9 +17,13 @@
 # License : BSD                                                               #
 # Copyright (c) 2020 DecisionScients                                          #
 # =========================================================================== #
-"""Top-level package for Data Studio."""
+"""Top-level package for Data Studio.
+
+Importing the package does not configure logging. Applications call
+configure_logging once from their entry point to log to the console and
+to a daily rotating log file.
+"""
 import logging
-import logging.config
 from logging.handlers import TimedRotatingFileHandler
 
 __author__ = """John James"""
@@ -29,21 +33,25 @@ __version__ = '0.1.0'
 # Logger functionality
 LOG_FILENAME = "datastudio.log"
 log = logging.getLogger(__name__)
-log.setLevel(logging.DEBUG)
+log.addHandler(logging.NullHandler())
+
+def configure_logging(filename=LOG_FILENAME):
+    """Adds rotating file and console handlers to the package logger."""
+    log.setLevel(logging.DEBUG)
 
-# Setup rotating file handler
-fh = TimedRotatingFileHandler(filename=LOG_FILENAME, when='midnight')
-fh.setLevel(logging.DEBUG)
+    # Setup rotating file handler
+    fh = TimedRotatingFileHandler(filename=filename, when='midnight')
+    fh.setLevel(logging.DEBUG)
 
-# Create console handler
-ch = logging.StreamHandler()
-ch.setLevel(logging.DEBUG)
+    # Create console handler
+    ch = logging.StreamHandler()
+    ch.setLevel(logging.DEBUG)
 
-# Create formatter and add it to handlers
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-fh.setFormatter(formatter)
-ch.setFormatter(formatter)
-# Add handlers to Logger
-log.addHandler(fh)
-log.addHandler(ch)
-log.info("Logger configuration complete!")
\ No newline at end of file
+    # Create formatter and add it to handlers
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    fh.setFormatter(formatter)
+    ch.setFormatter(formatter)
+    # Add handlers to Logger
+    log.addHandler(fh)
+    log.addHandler(ch)
+    log.info("Logger configuration complete!")
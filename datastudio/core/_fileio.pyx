@@ -0,0 +1,77 @@
+# cython: language_level=3
+# =========================================================================== #
+# Project : Data Studio                                                       #
+# Version : 0.1.0                                                             #
+# File    : _fileio.pyx                                                       #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Compiled path parsing for the file module.
+
+The functions return the same results as os.path.split and os.path.splitext
+on POSIX systems, scanning the path once from the end rather than making
+two passes. The file module imports them when the extension is built and
+falls back to the os.path functions otherwise.
+
+    * split_path : Returns the directory, filename, root and extension.
+    * file_ext : Returns the extension of a path.
+    * lookup_handler : Returns the handler registered for a path's extension.
+"""
+
+
+cdef inline Py_ssize_t _scan(str path, Py_ssize_t* dot):
+    """Returns the index of the last '/' and sets 'dot' to the extension dot."""
+    cdef Py_ssize_t i = len(path) - 1
+    cdef Py_ssize_t j
+    cdef Py_UCS4 c
+    dot[0] = -1
+    while i >= 0:
+        c = path[i]
+        if c == u'/':
+            break
+        if c == u'.' and dot[0] < 0:
+            dot[0] = i
+        i -= 1
+    # A leading run of dots, e.g. '.bashrc', is part of the root
+    if dot[0] >= 0:
+        c = u'.'
+        for j in range(i + 1, dot[0]):
+            if path[j] != u'.':
+                c = path[j]
+                break
+        if c == u'.':
+            dot[0] = -1
+    return i
+
+
+cpdef tuple split_path(str path):
+    """Returns the directory, filename, filename root and extension of 'path'."""
+    cdef Py_ssize_t dot
+    cdef Py_ssize_t sep = _scan(path, &dot)
+    cdef str directory = path[:sep + 1]
+    cdef str filename = path[sep + 1:]
+    if directory and directory.strip(u'/'):
+        directory = directory.rstrip(u'/')
+    if dot < 0:
+        return directory, filename, filename, u''
+    return directory, filename, path[sep + 1:dot], path[dot:]
+
+
+cpdef str file_ext(str path):
+    """Returns the extension of 'path', including the leading dot."""
+    cdef Py_ssize_t dot
+    _scan(path, &dot)
+    return path[dot:] if dot >= 0 else u''
+
+
+cpdef object lookup_handler(dict handlers, str path):
+    """Returns the handler in 'handlers' for the extension of 'path', or None."""
+    cdef Py_ssize_t dot
+    _scan(path, &dot)
+    return handlers.get(path[dot:] if dot >= 0 else u'')
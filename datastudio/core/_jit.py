@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Data Studio                                                       #
+# Version : 0.1.0                                                             #
+# File    : _jit.py                                                           #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/datastudio                     #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Compiled kernels for filtering and sorting columns of data.
+
+The kernels operate on NumPy arrays rather than rows of a DataFrame. They
+are compiled with numba when it is installed, and fall back to vectorized
+NumPy expressions otherwise. Compilation happens on first use and is
+cached on disk, so importing this module does not import numba.
+
+    * range_mask : Returns a mask of the values within a closed range.
+    * stable_order : Returns the stable sort order of one or more columns.
+"""
+import functools
+from importlib.util import find_spec
+
+import numpy as np
+
+_HAS_NUMBA = find_spec('numba') is not None
+
+@functools.lru_cache(maxsize=None)
+def _range_mask_kernel():
+    """Compiles the range mask kernel. numba specializes it per dtype."""
+    from numba import njit, prange
+
+    @njit(cache=True, parallel=True)
+    def kernel(values, lo, hi):
+        out = np.empty(values.shape[0], np.bool_)
+        for i in prange(values.shape[0]):
+            out[i] = lo <= values[i] <= hi
+        return out
+
+    return kernel
+
+def range_mask(values, lo, hi):
+    """Returns a boolean mask of the elements of 'values' in [lo, hi].
+
+    Numeric arrays are evaluated by the compiled kernel, in parallel and
+    in a single pass. Other arrays, and all arrays when numba is not
+    installed, are evaluated with NumPy comparisons. NaN is never in range.
+    """
+    if _HAS_NUMBA and values.dtype.kind in 'iuf':
+        return _range_mask_kernel()(values, lo, hi)
+    return (values >= lo) & (values <= hi)
+
+def stable_order(columns):
+    """Returns the indices that stably sort rows by 'columns'.
+
+    Parameters
+    ----------
+    columns : list of numpy arrays
+        The sort keys, most significant first, each with one element per
+        row.
+
+    """
+    order = np.arange(len(columns[0]))
+    # Stable sorts from the least to the most significant key
+    for values in reversed(columns):
+        order = order[np.argsort(values[order], kind='stable')]
+    return order
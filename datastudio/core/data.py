@@ -53,15 +53,32 @@ subclasses corresponding to each DataStore subclass above.
 """
 
 from abc import ABC, abstractmethod
-from collections import OrderedDict
+import atexit
+from collections import deque
+import copy
+from functools import cached_property
+import itertools
+import os
+import threading
+import weakref
 import pandas as pd
 from tabulate import tabulate
 
-from datastudio.core.file import FileIO
+from datastudio.core._jit import range_mask, stable_order
+from datastudio.core.file import FileIO, read_many, write_many
 from datastudio.core.metadata import MetadataRemoteFactory
 from datastudio.core.metadata import MetadataRDBMSFactory
 from datastudio.core.metadata import MetadataFileFactory
 from datastudio.core.metadata import MetadataDataCollectionFactory
+
+# FileIO holds no state, so one instance is shared by every file store and 
+# source, and is safe to use from multiple threads.
+_DEFAULT_IO = FileIO()
+# Lowercased class names, used in DataCollection keys, by class.
+_LOWER_NAME_CACHE = {}
+# Set to True to hand DataSet.save calls to a single background writer,
+# which combines the saves of all threads into batched writes.
+batch_saves = False
 # =========================================================================== #
 #                              DATASET CLASSES                                #
 # =========================================================================== #
@@ -76,16 +93,27 @@ class AbstractDataSet(ABC):
         self._locked = False
         self._is_collection = False
         self._data = pd.DataFrame
-        self.metadata = self._build_metadata(name, kwargs)
+        self._metadata_params = kwargs
+
+    @cached_property
+    def metadata(self):
+        """Returns the Metadata object, which is built on first access."""
+        return self._build_metadata()
 
-    def _build_metadata(self, name, **kwargs):
-        factory = MetadataFileFactory(self, name, **kwargs)
+    def _build_metadata(self):
+        factory = MetadataFileFactory(self, self._name, 
+                                      **self._metadata_params)
         factory.create_admin() 
         factory.create_desc() 
         factory.create_tech() 
         factory.create_process() 
         return factory.metadata              
 
+    @property
+    def name(self):
+        """Returns the name of the DataSet."""
+        return self._name
+
     @property
     def size(self):
         return self.metadata['tech'].get('size')
@@ -184,22 +212,31 @@ class DataSet(AbstractDataSet):
     def source(self):
         """Reads the data from the DataSource object. """
         if self._datasource:
-            self._data = self._datasource.read()
+            self._data = self._datasource.load()
         else:
             raise Exception("Unable to source. A DataSource has not been designated")
 
     def load(self):
         """ Reads the data from the DataStore object."""
         if self._datastore:
-            self._data = self._datastore.read()
+            self._data = self._datastore.load()
         else:
             raise Exception("Unable to load. A DataStore has not been designated")
 
     def save(self):
-        """ Saves data back to the datasource."""
+        """ Saves data back to the datastore.
+        
+        When the module attribute batch_saves is True, a copy of the data
+        is queued for the background writer and this method returns 
+        immediately, so later changes to the DataFrame are not written. 
+        Call flush_saves() to wait for queued saves to be written.
+        """
 
         if self._datastore:
-            self._datastore.write(self._data)
+            if batch_saves:
+                _WRITE_COMBINER.submit(self._datastore, self._data.copy())
+            else:
+                self._datastore.save(self._data)
         else:
             raise Exception("Unable to save. A DataStore has not been designated")
 
@@ -212,13 +249,15 @@ class DataCollection(AbstractDataSet):
     def __init__(self, name, entity=None, **kwargs):
         super(DataCollection, self).__init__(name, **kwargs)
         self._filter = None
+        self._orderby = None
         self._is_collection = True
-        self._collection = OrderedDict()
+        self._collection = {}
+        # Maps member names to the list of their keys, in the order added, 
+        # for constant time lookup by name. A DataSet and a DataCollection
+        # may share a name.
+        self._name_index = {}
         if entity:
-            key = self._format_key(entity)
-            self._collection[key] = entity
-
-        self.metadata = self._build_metadata()
+            self.add(entity)
 
     def _build_metadata(self):
         factory = MetadataDataCollectionFactory(self, self._name)
@@ -229,18 +268,22 @@ class DataCollection(AbstractDataSet):
         return factory.metadata
 
     def _format_key(self, entity, name=None):
-        if name:
-            key = entity.__class__.__name__.lower() + "_" + name
-        else:
-            key = entity.__class__.__name__.lower() + "_" + entity.name
-        return key
+        cls = type(entity)
+        base = _LOWER_NAME_CACHE.get(cls) or \
+            _LOWER_NAME_CACHE.setdefault(cls, cls.__name__.lower())
+        return f"{base}_{name or entity.name}"
 
     def get_member(self, name):
-        """Returns a DataSet or DataCollection object matching the given name."""
-        try:
-            entity = next( v for k,v in self._collection.items() if name == v.name)
-        except KeyError as e:
-            print(e)
+        """Returns a DataSet or DataCollection object matching the given name.
+        
+        If more than one member has the name, the first added is returned.
+        Returns None if no member has the name.
+        """
+        keys = self._name_index.get(name)
+        if not keys:
+            print("No member named '{name}'. None returned.".format(name=name))
+            return None
+        return self._collection[keys[0]]
 
 
     def add(self, entity, name=None):
@@ -264,11 +307,12 @@ class DataCollection(AbstractDataSet):
         
         """
         key = self._format_key(entity, name)
-        if key in self._collection.keys():
+        if key in self._collection:
             raise KeyError("Unable to add {name}. The key already exists."\
-                .format(name=entity.get('name', "Name is Null")))
+                .format(name=entity.name))
         else:
             self._collection[key] = entity
+            self._name_index.setdefault(entity.name, []).append(key)
 
     def change(self, key, entity):
         """Changes the DataSet or DataCollection for a given key.
@@ -290,11 +334,13 @@ class DataCollection(AbstractDataSet):
         
         """
         
-        if key not in self._collection.keys():
+        if key not in self._collection:
             raise KeyError("The designated key, '{key}', does not exist."\
                 .format(key=key))
         else:
+            self._unindex(key)
             self._collection[key] = entity
+            self._name_index.setdefault(entity.name, []).append(key)
     
     def remove(self, key):
         """Removes the DataSet or DataCollection object at the designated key.
@@ -307,14 +353,32 @@ class DataCollection(AbstractDataSet):
             The key associated with the object to remove.
         
         """
-        del self._collection[key]
+        self._unindex(key)
+        self._collection.pop(key, None)
+
+    def _unindex(self, key):
+        """Removes 'key' from the name index entry of its member, if any."""
+        entity = self._collection.get(key)
+        if entity is None:
+            return
+        keys = self._name_index.get(entity.name)
+        if keys and key in keys:
+            keys.remove(key)
+            if not keys:
+                del self._name_index[entity.name]
 
     def copy(self, entity, name=None):
         """Copies a member DataSet or DataCollection object.
 
+        The copy is shallow. A DataSet copy shares its DataSource, DataStore
+        and DataFrame buffers with the original rather than copying the 
+        data; unless pandas copy-on-write is enabled, in place changes to 
+        the values of one are visible in the other. A DataCollection copy
+        shares its members. The copy gets its own metadata.
+
         The new object is assigned a key containing the class and the name.
-        If the name is not provided, a key will be created using the 
-        class name and the generated UUID.
+        If the name is not provided, the name of the original suffixed 
+        with '_copy' is used.
 
         Parameters
         ----------
@@ -324,39 +388,168 @@ class DataCollection(AbstractDataSet):
             The name to be assigned to the new object.
 
         """
-        key = self._format_key(entity, name=name)
-        clone = copy.deepcopy(entity)
-        self._add(clone, name)
+        name = name or entity.name + '_copy'
+        if entity._is_collection:
+            clone = copy.copy(entity)
+            clone._name = name
+            clone._collection = dict(entity._collection)
+            clone._name_index = {k: list(v) for k, v in 
+                                 entity._name_index.items()}
+            # Drop the metadata cached from the original
+            clone.__dict__.pop('metadata', None)
+        else:
+            clone = DataSet(name, datasource=entity.datasource, 
+                            datastore=entity.datastore)
+            if isinstance(entity.dataframe, pd.DataFrame):
+                clone.dataframe = entity.dataframe.copy(deep=False)
+        self.add(clone, name)
 
+    def set_filter(self, filter):
+        """Sets the filter applied to the members of the collection.
 
-    #TODO: Create filter capability see https://github.com/swl10/pyslet/blob/b30e9a439f6c0f0e2d01f1ac80986944bed7427b/pyslet/odata2/core.py#L498
+        Parameters
+        ----------
+        filter : dict
+            Maps column names to (lo, hi) tuples. An observation passes 
+            the filter if each of its values is within the closed range
+            for its column.
 
-    def set_filter(self, filter):
-        pass
+        """
+        self._filter = dict(filter)
 
     def check_filter(self, observation):
-        pass
+        """Returns True if an observation passes the filter.
 
-    def apply_filter(self, filter):
-        pass
+        Parameters
+        ----------
+        observation : dict or pandas Series
+            The values of a single observation, indexed by column name.
+
+        """
+        if not self._filter:
+            return True
+        return all(lo <= observation[column] <= hi 
+                   for column, (lo, hi) in self._filter.items())
+
+    def _filter_mask(self, df, filter):
+        """Returns the boolean mask of the rows of 'df' passing 'filter'."""
+        mask = None
+        for column, (lo, hi) in filter.items():
+            m = range_mask(df[column].to_numpy(), lo, hi)
+            mask = m if mask is None else mask & m
+        return mask
+
+    def apply_filter(self, filter=None):
+        """Returns the observations of each member that pass the filter.
+
+        Each column is filtered as a whole array by a compiled kernel,
+        rather than checking one observation at a time. Members without
+        data, or without all of the filtered columns, are skipped.
+
+        Parameters
+        ----------
+        filter : dict Optional
+            Maps column names to (lo, hi) tuples. Defaults to the filter
+            set by set_filter.
+
+        Returns
+        -------
+        dict
+            Maps member names to DataFrames of the filtered observations.
+
+        """
+        filter = filter or self._filter or {}
+        results = {}
+        for v in self._collection.values():
+            if v._is_collection:
+                results.update(v.apply_filter(filter))
+                continue
+            df = v.dataframe
+            if not isinstance(df, pd.DataFrame) or \
+                not all(column in df.columns for column in filter):
+                continue
+            if filter:
+                df = df[self._filter_mask(df, filter)]
+            results[v.name] = df
+        return results
 
     def set_orderby(self, orderby):
-        pass
+        """Sets the column, or list of columns, by which data are sorted."""
+        if isinstance(orderby, str):
+            orderby = [orderby]
+        self._orderby = list(orderby)
 
     def sort_data(self, observations):
-        pass
+        """Returns the observations stably sorted by the orderby columns.
+
+        Parameters
+        ----------
+        observations : pandas DataFrame
+            The observations to sort. Returned unchanged if no orderby 
+            columns have been set.
+
+        Numeric keys without missing values are ordered by the argsort
+        kernel. Other keys, such as strings or columns with nulls, are 
+        sorted by pandas.
+
+        """
+        if not self._orderby or observations.empty:
+            return observations
+        columns = []
+        for column in self._orderby:
+            series = observations[column]
+            values = series.to_numpy()
+            if values.dtype.kind not in 'biuf' or series.hasnans:
+                return observations.sort_values(self._orderby, kind='stable')
+            columns.append(values)
+        return observations.iloc[stable_order(columns)]
 
     def source(self, name):
         """Reads the data from the DataSource object. """
         self._data = self._datasource.load()
 
     def load(self):
-        """ Reads the data from the DataStore object."""
-        pass
+        """Loads the data of each member DataSet from its DataStore.
+
+        Members stored in files are read as one concurrent batch, rather 
+        than one file at a time. Nested DataCollections load their own 
+        members, and members without a DataStore are skipped.
+        """
+        members = []
+        for v in self._collection.values():
+            if v._is_collection:
+                v.load()
+            elif v.datastore is None:
+                continue
+            elif isinstance(v.datastore, DataStoreFile):
+                members.append(v)
+            else:
+                v.load()
+        if members:
+            paths = [v.datastore.path for v in members]
+            for v, data in zip(members, DataStoreFile.load_many(paths)):
+                if data is not None:
+                    v.dataframe = data
 
     def save(self):
-        """ Saves data back to the datasource."""
-        pass
+        """Saves the data of each member DataSet to its DataStore.
+
+        Members stored in files are written as one concurrent batch. Nested
+        DataCollections save their own members, and members without data
+        or a DataStore are skipped.
+        """
+        items = []
+        for v in self._collection.values():
+            if v._is_collection:
+                v.save()
+            elif v.datastore is None or not isinstance(v.dataframe, pd.DataFrame):
+                continue
+            elif isinstance(v.datastore, DataStoreFile):
+                items.append((v.datastore.path, v.dataframe))
+            else:
+                v.save()
+        if items:
+            DataStoreFile.save_many(items)
 
     def lock(self, name=None):
         """Lock all composite members or the member with the matching name.
@@ -364,14 +557,14 @@ class DataCollection(AbstractDataSet):
         Parameters
         ----------
         name : str
-            Names are lower case and have the format 'classname_name'.
+            The name of the member, e.g. 'listings'.
         """   
         if name:
-            entities = next( v for k,v in self._collection.items() if name == v.name)
-            for k, v in entities.items():
-                v.lock()
+            entity = self.get_member(name)
+            if entity is not None:
+                entity.lock()
         else:
-            for k, v in self._collection.items():
+            for v in self._collection.values():
                 v.lock()
 
     def unlock(self, name=None):
@@ -380,39 +573,29 @@ class DataCollection(AbstractDataSet):
         Parameters
         ----------
         name : str
-            Names are lower case and have the format 'classname_name'.
+            The name of the member, e.g. 'listings'.
         """         
         if name:
-            entities = next( v for k,v in self._collection.items() if name == v.name)
-            for k, v in entities.items():
-                v.lock()
+            entity = self.get_member(name)
+            if entity is not None:
+                entity.unlock()
         else:
-            for k, v in self._collection.items():
-                v.lock()
+            for v in self._collection.values():
+                v.unlock()
 
     def print_members(self):
-        classes = []
-        names = []
-        locked = []        
-        sizes = []
-        created = []
-        modified = []
-        updates = []
-        user = []
-        for k, v in self._collection.items():
-            classes.append(v.__class__.__name__)
-            names.append(v.name)
-            locked.append(v.is_locked)
-            sizes.append(v.metadata.get('technical').get('object_size'))
-            created.append(v.metadata.get('administrative').get('created'))
-            modified.append(v.metadata.get('administrative').get('modified'))
-            updates.append(v.metadata.get('administrative').get('updates'))
-            user.append(v.metadata.get('administrative').get('creator'))
-
-        d = {"Class": classes, "Name": names, "Is Locked?": locked, "Size": sizes,
-             "Created": created, "Modified": modified, "Updates": updates, 
-             "User": user}
-        print(tabulate(d, headers="keys"))
+        headers = ["Class", "Name", "Is Locked?", "Size", "Created", 
+                   "Modified", "Updates", "User"]
+        rows = []
+        for v in self._collection.values():
+            # Each metadata object is looked up once per member
+            metadata = v.metadata
+            admin = metadata.get('administrative')
+            rows.append((v.__class__.__name__, v.name, v.is_locked,
+                         metadata.get('technical').get('object_size'),
+                         admin.get('created'), admin.get('modified'),
+                         admin.get('updates'), admin.get('creator')))
+        print(tabulate(rows, headers=headers))
 
 # =========================================================================== #
 #                            DATA STORE CLASSES                               #
@@ -439,6 +622,11 @@ class AbstractDataStore(ABC):
         self._locked = False
         self._is_collection = False        
 
+    @cached_property
+    def metadata(self):
+        """Returns the Metadata object, which is built on first access."""
+        return self._build_metadata()
+
     @property
     def name(self):
         """Returns the name of the DataSet."""
@@ -447,8 +635,10 @@ class AbstractDataStore(ABC):
     @name.setter
     def name(self, value):
         self._name = value
-        admin = next( v for k,v in self._metadata.items() if k.startswith('admin'))
-        admin.change('name', value)
+        # Metadata that has not been built yet will be built with the name
+        metadata = self.__dict__.get('metadata')
+        if metadata is not None:
+            metadata.get('administrative').change('name', value)
 
     @abstractmethod
     def load(self):
@@ -477,9 +667,8 @@ class DataStoreFile(AbstractDataStore):
 
     def __init__(self, name, path):
         super(DataStoreFile, self).__init__(name, path)                
-        self._io = FileIO()
+        self._io = _DEFAULT_IO
         self._path = path
-        self.metadata = self._build_metadata()
 
     def _build_metadata(self):
         factory = MetadataFileFactory(self, self._name, path=self._path)
@@ -493,6 +682,11 @@ class DataStoreFile(AbstractDataStore):
         """ Loads data from designated path and returns as DataFrame."""
         return self._io.read(self._path)
     
+    @property
+    def path(self):
+        """Returns the path of the file."""
+        return self._path
+
     def save(self, data):
         """ Saves data to the designated path.
 
@@ -502,8 +696,139 @@ class DataStoreFile(AbstractDataStore):
             Contains the data to saved.
 
         """
-        self._io.write(data)
+        self._io.write(self._path, data)
+
+    @staticmethod
+    def load_many(paths):
+        """Loads DataFrames from a list of paths as one concurrent batch.
+
+        Parameters
+        ----------
+        paths : list of str
+            The paths of the files to be loaded.
+
+        Returns
+        -------
+        list : The DataFrame read from each path, or None if the read failed.
+
+        """
+        return read_many(paths)
 
+    @staticmethod
+    def save_many(items):
+        """Saves DataFrames to their paths as one concurrent batch.
+
+        Parameters
+        ----------
+        items : list of (str, pd.DataFrame) tuples
+            The paths and the DataFrames to be saved to them.
+
+        Returns
+        -------
+        list : The path written for each item, or None if the write failed.
+
+        """
+        return write_many(items)
+
+
+# --------------------------------------------------------------------------- #
+#                             _WriteCombiner                                  #
+# --------------------------------------------------------------------------- #
+class _WriteCombiner:
+    """Combines DataSet saves from many threads onto one writer thread.
+
+    Each producer thread appends (sequence, datastore, data) items to its
+    own deque, so producers never contend with one another. A daemon 
+    thread drains the deques and writes the pending file saves with one 
+    DataStoreFile.save_many call per pass. When a path is saved more than
+    once between passes, only the data with the latest sequence number is
+    written, whichever thread saved it.
+    """
+
+    def __init__(self):
+        # (weak reference to the producer thread, its deque) pairs
+        self._queues = []
+        self._local = threading.local()
+        self._sequence = itertools.count()
+        self._register_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = threading.Event()
+        self._thread = None
+
+    def submit(self, datastore, data):
+        """Queues 'data' to be saved to 'datastore'."""
+        queue = getattr(self._local, 'queue', None)
+        if queue is None:
+            queue = self._local.queue = deque()
+            with self._register_lock:
+                self._queues.append(
+                    (weakref.ref(threading.current_thread()), queue))
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name='datastudio-writer', 
+                        daemon=True)
+                    self._thread.start()
+        queue.append((next(self._sequence), datastore, data))
+        self._pending.set()
+
+    def _run(self):
+        while True:
+            self._pending.wait()
+            self._pending.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(e)
+
+    def flush(self):
+        """Writes all queued saves before returning."""
+        with self._flush_lock:
+            with self._register_lock:
+                queues = [queue for _, queue in self._queues]
+            items = []
+            for queue in queues:
+                while queue:
+                    items.append(queue.popleft())
+            # Saves are applied in the order they were submitted, so the 
+            # latest save of a path replaces earlier ones from any thread
+            items.sort(key=lambda item: item[0])
+            files = {}
+            for _, datastore, data in items:
+                if isinstance(datastore, DataStoreFile):
+                    files[datastore.path] = data
+                else:
+                    self._save(datastore.save, data)
+            if files:
+                self._save(DataStoreFile.save_many, list(files.items()))
+            self._prune()
+
+    def _prune(self):
+        """Drops the empty deques of producer threads that have exited."""
+        with self._register_lock:
+            queues = []
+            for ref, queue in self._queues:
+                thread = ref()
+                if queue or (thread is not None and thread.is_alive()):
+                    queues.append((ref, queue))
+            self._queues = queues
+
+    def _save(self, save, data):
+        """Calls save(data), printing any error rather than raising it.
+
+        One failed save must not stop the writer thread.
+        """
+        try:
+            save(data)
+        except Exception as e:
+            print(e)
+
+_WRITE_COMBINER = _WriteCombiner()
+# Queued saves are written before the interpreter exits
+atexit.register(_WRITE_COMBINER.flush)
+
+def flush_saves():
+    """Writes all DataSet saves queued while batch_saves is True."""
+    _WRITE_COMBINER.flush()
 
 # =========================================================================== #
 #                            DATA SOURCE CLASSES                              #
@@ -529,6 +854,11 @@ class AbstractDataSource(ABC):
         self._locked = False
         self._is_collection = False
 
+    @cached_property
+    def metadata(self):
+        """Returns the Metadata object, which is built on first access."""
+        return self._build_metadata()
+
     @property
     def name(self):
         """Returns the name of the DataSet."""
@@ -537,8 +867,10 @@ class AbstractDataSource(ABC):
     @name.setter
     def name(self, value):
         self._name = value
-        admin = next( v for k,v in self._metadata.items() if k.startswith('admin'))
-        admin.change('name', value)
+        # Metadata that has not been built yet will be built with the name
+        metadata = self.__dict__.get('metadata')
+        if metadata is not None:
+            metadata.get('administrative').change('name', value)
 
     @abstractmethod
     def load(self):
@@ -556,15 +888,19 @@ class DataSourceFile(AbstractDataSource):
 
     Parameters
     ----------
-    path : str
+    path : str or path-like
         The relative path for the file
     """
 
-    def __init__(self, name, **kwargs):
+    def __init__(self, name, path, **kwargs):
         super(DataSourceFile, self).__init__(name, **kwargs)                
-        self._io = FileIO()
-        self._path = next(v for (k,v) in kwargs.items() if 'path' in k)
-        self.metadata = self._build_metadata()
+        self._io = _DEFAULT_IO
+        self._path = os.fspath(path)
+
+    @property
+    def path(self):
+        """Returns the path of the file."""
+        return self._path
 
     def _build_metadata(self):
         factory = MetadataFileFactory(self, self._name, path=self._path)
@@ -20,6 +20,7 @@
 # =========================================================================== #
 """Module containing entity related interfaces."""
 from abc import ABC, abstractmethod
+from functools import cached_property
 from datastudio.core.metadata import MetadataEntityFactory 
 # --------------------------------------------------------------------------- #
 #                               Entity                                        #
@@ -43,8 +44,12 @@ class Entity(ABC):
     """
 
     def __init__(self, name, **kwargs):
-        self._name        
-        self.metadata = self._build_metadata()
+        self._name = name
+
+    @cached_property
+    def metadata(self):
+        """Returns the Metadata object, which is built on first access."""
+        return self._build_metadata()
 
     def _build_metadata(self):
         factory = MetadataEntityFactory(self, self._name)
@@ -62,5 +67,7 @@ class Entity(ABC):
     @name.setter
     def name(self, value):
         self._name = value
-        admin = next( v for k,v in self._metadata.items() if k.startswith('admin'))
-        admin.change('name', value)
+        # Metadata that has not been built yet will be built with the name
+        metadata = self.__dict__.get('metadata')
+        if metadata is not None:
+            metadata.get('administrative').change('name', value)
@@ -22,19 +22,205 @@
 There types of classes are included in this module.
 
     * File : Concrete class that encapsulates a single file on disk.
+    * FileGroup : A named collection of File objects.
+    * FileLockedError : Raised when a locked file is moved, renamed or written.
     * FileIO : Abstract base class for file input and output.
     * FileIOCSV : File handler for CSV files    
     * FileIOCSVGZ : File handler for .GZ compressed files    
+    * FileIOCSVPolars : Polars backed reader for CSV files
+    * FileIOCSVgzPolars : Polars backed reader for .GZ compressed files
+    * FileIOParquet : File handler for Parquet files
+    * FileIOFeather : File handler for Feather (Arrow IPC) files
+    * FileIOJSON : File handler for JSON files
+    * FileIONumpy : File handler for .npy and .npz files
     * FileIOStrategy : Returns a file hander based upon file extension.
+    * read_file, write_file : Read or write a path with the handler for its
+      extension, without constructing a FileIO object.
+    * read_many, write_many : Read or write a list of paths concurrently.
     
+The Polars backed readers are opt-in. They are used for .csv and .gz files
+when polars is installed and the DATASTUDIO_FAST_IO environment variable
+is set to '1'. Reads fall back from Polars to pyarrow to pandas, depending
+upon which are installed.
+
+Path parsing uses the optional compiled _fileio extension when it has been
+built with Cython, and the os.path functions otherwise.
+
 File types which support tabular data have been prioritized. Support for
 additional file formats will be added to future releases if and
 when needed.
 """
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import functools
+import gzip
+import importlib
+from importlib.util import find_spec
+import io
+import json
 import os
 import shutil
-import pandas as pd
+import sys
+
+class _LazyModule:
+    """Imports a module, and the named submodules, on first attribute access.
+
+    Importing this module does not import numpy, pandas or the optional
+    dependencies, so File objects can be used for path handling without
+    paying for them. Optional dependencies which are not installed are None.
+    """
+
+    def __init__(self, name, submodules=()):
+        self._name = name
+        self._submodules = submodules
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            module = importlib.import_module(self._name)
+            for submodule in self._submodules:
+                importlib.import_module(self._name + '.' + submodule)
+            self._module = module
+        return getattr(self._module, attr)
+
+def _lazy_import(name, submodules=()):
+    """Returns a _LazyModule for 'name', or None if it is not installed."""
+    if find_spec(name) is None:
+        return None
+    return _LazyModule(name, submodules)
+
+np = _LazyModule('numpy')
+pd = _LazyModule('pandas')
+pa = _lazy_import('pyarrow', ('csv', 'dataset', 'feather', 'parquet'))
+pl = _lazy_import('polars')
+indexed_gzip = _lazy_import('indexed_gzip')
+
+_POSIX = os.name == 'posix'
+
+# Compressed CSV files larger than this are decompressed and parsed as a stream
+_LARGE_GZ_BYTES = 128 * 1024 * 1024
+# Bytes handed to each pyarrow CSV parsing thread
+_ARROW_BLOCK_SIZE = 8 << 20
+# Rows formatted per batch by the pyarrow CSV writer
+_ARROW_WRITE_BATCH = 65536
+# Rows formatted per chunk by the pandas CSV writer
+_PANDAS_WRITE_CHUNK = 100000
+# Default gzip level for writes, favoring speed over compression ratio
+_GZIP_LEVEL = 1
+# Buffer sizes for files handed to the pandas parser as binary streams
+_READ_BUFFER = 128 * 1024
+_GZIP_READ_BUFFER = 64 * 1024
+# Buffer size for files opened for writing, to coalesce small writes
+_WRITE_BUFFER = 1 << 20
+# .npy files larger than this are memory mapped rather than read into memory
+_LARGE_NPY_BYTES = 64 * 1024 * 1024
+
+def _split_path(path):
+    """Returns the directory, filename, filename root and extension of 'path'.
+
+    The results match os.path.split and os.path.splitext. On POSIX systems
+    the path is split with str.rfind rather than os.path.
+    """
+    if _POSIX:
+        i = path.rfind('/')
+        directory, filename = path[:i + 1], path[i + 1:]
+        # As with os.path.split, trailing separators are dropped from the
+        # directory unless it is the root
+        if directory.strip('/'):
+            directory = directory.rstrip('/')
+    else:
+        directory, filename = os.path.split(path)
+    root, dot, ext = filename.rpartition('.')
+    # As with os.path.splitext, leading dots are part of the root
+    if root.strip('.'):
+        return directory, filename, root, dot + ext
+    return directory, filename, filename, ''
+
+def _file_ext(path):
+    """Returns the extension of 'path', including the leading dot."""
+    if not _POSIX:
+        return os.path.splitext(path)[1]
+    i = path.rfind('/')
+    j = path.rfind('.')
+    if j > i and path[i + 1:j].strip('.'):
+        return path[j:]
+    return ''
+
+def _lookup_handler(handlers, path):
+    """Returns the handler in 'handlers' for the extension of 'path', or None."""
+    return handlers.get(_file_ext(path))
+
+# The compiled path parsers and handler lookup in _fileio replace the pure 
+# Python versions above when the extension has been built. They assume '/' 
+# separated paths, and may be disabled by setting the DATASTUDIO_CYTHON 
+# environment variable to '0'.
+if _POSIX and os.environ.get('DATASTUDIO_CYTHON') != '0':
+    try:
+        from datastudio.core._fileio import split_path as _split_path
+        from datastudio.core._fileio import file_ext as _file_ext
+        from datastudio.core._fileio import lookup_handler as _lookup_handler
+    except ImportError:
+        pass
+
+def _read_bytes(path, limit=None):
+    """Returns the bytes of 'path', or the first 'limit' bytes.
+
+    The file is read with os.read into a buffer sized by fstat, bypassing 
+    the buffered io layer. A single read suffices for regular files. Files
+    reporting a size of 0, such as procfs files and pipes, are read until
+    end of file.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return _read_to_eof(fd, limit)
+        if limit is not None:
+            size = min(size, limit)
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        data = os.read(fd, size)
+        if len(data) == size:
+            return data
+        chunks = [data]
+        size -= len(data)
+        while size > 0:
+            chunk = os.read(fd, size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b''.join(chunks)
+    finally:
+        os.close(fd)
+
+def _read_to_eof(fd, limit=None):
+    """Reads 'fd' until end of file, or until 'limit' bytes are read."""
+    chunks = []
+    remaining = limit
+    while remaining is None or remaining > 0:
+        n = _READ_BUFFER if remaining is None else min(_READ_BUFFER, remaining)
+        chunk = os.read(fd, n)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        if remaining is not None:
+            remaining -= len(chunk)
+    return b''.join(chunks)
+
+# ---------------------------------------------------------------------------- #
+#                               FileLockedError                                #   
+# ---------------------------------------------------------------------------- #
+class FileLockedError(Exception):
+    """Raised when a move, rename or write is attempted on a locked file."""
+
+    def __init__(self, path):
+        super(FileLockedError, self).__init__(path)
+        self.path = path
+
+    def __str__(self):
+        return "The file, {fname}, is locked.".format(fname=self.path)
 
 # ---------------------------------------------------------------------------- #
 #                                     FILE                                     #   
@@ -56,15 +242,35 @@ class File:
     
     """
 
+    __slots__ = ('_name', '_path', '_directory', '_filename', '_fileext',
+                 '_handler', '_locked', '_stat')
+
     def __init__(self, path, name=None):
-        self._name = name or os.path.splitext(os.path.basename(path))[0]
-        self._path = path
-        self._directory = os.path.dirname(path)
+        root = self._update_filename_data(path)
+        self._name = name or root
         self._locked = False
-        self._exists = os.path.exists(path)    
-        self._filename =  os.path.basename(path)
-        self._fileext = os.path.splitext(path)[1]
-        self._io = FileIO()
+
+    @classmethod
+    def from_direntry(cls, entry, name=None):
+        """Returns a File for an os.DirEntry yielded by os.scandir.
+
+        The file is not stat'ed until exists, size or mtime is queried, 
+        except on Windows, where the directory listing supplies the stat
+        result without a further call.
+
+        Parameters
+        ----------
+        entry : os.DirEntry
+            The directory entry for the file.
+        name : str (Optional)
+            The name for the File object. Defaults to the filename, 
+            extension included.
+
+        """
+        file = cls(entry.path, name=name or entry.name)
+        if not _POSIX:
+            file._stat = entry.stat()
+        return file
 
     @property
     def name(self):
@@ -93,8 +299,55 @@ class File:
 
     @property
     def exists(self):
-        """Returns True if the file exists, returns False otherwise."""
-        return self._exists
+        """Returns True if the file exists, returns False otherwise.
+        
+        The file system is queried on each access, so the result is never
+        stale. The query also refreshes the cached size and mtime.
+        """
+        return self.refresh()
+
+    def refresh(self):
+        """Queries the file system and updates the cached size and mtime.
+
+        Returns
+        -------
+        bool : True if the file exists, False otherwise.
+
+        """
+        self._stat = False
+        return self._get_stat() is not None
+
+    @property
+    def size(self):
+        """Returns the size of the file in bytes, or None if not exists.
+        
+        The value is cached from the last stat of the file; call refresh()
+        to pick up changes made outside of this object.
+        """
+        st = self._get_stat()
+        return st.st_size if st is not None else None
+
+    @property
+    def mtime(self):
+        """Returns the last modified time of the file, or None if not exists.
+        
+        Like size, the value is cached until refresh() is called.
+        """
+        st = self._get_stat()
+        return st.st_mtime if st is not None else None
+
+    def _get_stat(self):
+        """Returns the cached os.stat result, or None if the file not exists.
+        
+        A single stat call supplies exists, size and mtime. The result is
+        cached until the file is written, moved or renamed.
+        """
+        if self._stat is False:
+            try:
+                self._stat = os.stat(self._path)
+            except OSError:
+                self._stat = None
+        return self._stat
 
     @property
     def is_locked(self):
@@ -105,20 +358,40 @@ class File:
         """Locks the file, preventing any updates or writes to the file."""
         self._locked = True        
 
+    def unlock(self):
+        """Unlocks the file."""
+        self._locked = False
+
     def _update_filename_data(self, path):
-        """Updates the directory, filename, and extension based upon 'path'."""
+        """Updates the directory, filename, and extension based upon 'path'.
+        
+        Returns the root of the filename, which is the default name.
+        """
         self._path = path
-        self._directory = os.path.dirname(path)
-        self._filename = os.path.basename(path)
-        self._fileext = os.path.splitext(path)[1]
-
-    def copy(self, path):
+        self._directory, self._filename, root, ext = _split_path(path)
+        # Interned to match the _FILE_HANDLERS keys by identity
+        self._fileext = sys.intern(ext)
+        # Resolved once per path, None for unsupported extensions
+        self._handler = _FILE_HANDLERS.get(self._fileext)
+        # False until first queried, None if the file does not exist
+        self._stat = False
+        return root
+
+    def copy(self, path, preserve_metadata=False):
         """ Copies a file from current location to 'path'.
+
+        Only the file contents are copied by default. shutil.copyfile 
+        copies them in the kernel, with sendfile on Linux, and skips the 
+        stat and chmod calls that copying metadata requires.
         
         Parameters
         ----------
         path : str
             The absolute or relative path to which the file should be copied.
+            If 'path' is a directory, the file is copied into it.
+        preserve_metadata : bool (Optional)
+            Also copy the permission bits, timestamps and flags, as with
+            shutil.copy2. Defaults to False.
             
         Returns
         ------
@@ -126,7 +399,11 @@ class File:
             The path to the new file.
 
         """
-        return shutil.copy2(self._path, path)
+        if preserve_metadata:
+            return shutil.copy2(self._path, path)
+        if os.path.isdir(path):
+            path = os.path.join(path, self._filename)
+        return shutil.copyfile(self._path, path)
 
     def move(self, path):        
         """ Moves a file from current location to 'path'.
@@ -142,16 +419,18 @@ class File:
         Returns
         ------
         str
-            The path to the new file if the file is unlocked. Returns None
-            if file is locked.
+            The path to the new file.
 
-        """
-        if self._is_unlocked(self._path, 'move'):
-            new_path = shutil.move(self._path, path)
-            self._update_filename_data(new_path)
-            return new_path
-        return None
+        Raises
+        ------
+        FileLockedError if the file is locked.
 
+        """
+        if self._locked:
+            raise FileLockedError(self._path)
+        new_path = shutil.move(self._path, path)
+        self._update_filename_data(new_path)
+        return new_path
 
     def rename(self, name):
         """ Renames a file.
@@ -166,26 +445,101 @@ class File:
         Returns
         ------
         str
-            The path to the new file if the file is unlocked. Returns None
-            if file is locked.
+            The path to the new file.
+
+        Raises
+        ------
+        FileLockedError if the file is locked.
 
         """
-        if self._is_unlocked(self._path, 'rename'):
-            new_path = os.path.splitext(\
-                os.path.join(self._directory, name))[0].replace("\\", "/")\
-                + self._fileext
-            os.rename(self._path, new_path)
-            self._update_filename_data(new_path)
-            return new_path
-        return None
+        if self._locked:
+            raise FileLockedError(self._path)
+        new_path = os.path.splitext(\
+            os.path.join(self._directory, name))[0].replace("\\", "/")\
+            + self._fileext
+        os.rename(self._path, new_path)
+        self._update_filename_data(new_path)
+        return new_path
+
+    def to_parquet(self):
+        """Writes a Parquet copy of the file next to the original.
+
+        The copy shares the path of the original, with the extension 
+        replaced by '.parquet'. Subsequent reads of the copy benefit from
+        columnar storage and column pruning at the storage layer.
 
-    def read(self, filter=None):
+        Returns
+        -------
+        File
+            The File object for the Parquet copy. Returns None if the copy
+            could not be written.
+
+        """
+        content = self.read()
+        if content is None:
+            return None
+        return self.write_parquet(content)
+
+    def to_feather(self):
+        """Writes an uncompressed Feather copy of the file next to the original.
+
+        The copy shares the path of the original, with the extension 
+        replaced by '.feather'. Reads of the copy memory map it, so column
+        buffers are paged in on demand and shared through the page cache 
+        rather than copied into memory. Use it for files that are read 
+        many times.
+
+        Returns
+        -------
+        File
+            The File object for the Feather copy. Returns None if the copy
+            could not be written.
+
+        """
+        content = self.read()
+        if content is None:
+            return None
+        path = os.path.splitext(self._path)[0] + '.feather'
+        if _get_file_handler('.feather').write(
+                path, content, compression='uncompressed') is None:
+            return None
+        return File(path, self._name)
+
+    def write_parquet(self, content):
+        """Writes 'content' to a Parquet file next to the original.
+
+        The Parquet file shares the path of the original, with the extension
+        replaced by '.parquet'. Use this in place of write when the file is
+        only read back by this package, avoiding the cost of formatting
+        and parsing text.
+
+        Parameters
+        ----------
+        content : DataFrame
+            The DataFrame to be written.
+
+        Returns
+        -------
+        File
+            The File object for the Parquet file. Returns None if the file 
+            could not be written.
+
+        """
+        path = os.path.splitext(self._path)[0] + '.parquet'
+        if _get_file_handler('.parquet').write(path, content) is None:
+            return None
+        return File(path, self._name)
+
+    def read(self, filter=None, **kwargs):
         """Reads and returns the file contents.
 
         Parameters
         ----------
         filter : array like (Optional)
             Specifies specific columns to read.
+        **kwargs : 
+            Format specific read options, passed to the file handler. For
+            example, CSV files accept a 'row_filter' expression.
 
         Returns
         -------
@@ -197,15 +551,39 @@ class File:
                 .txt                    string
                 .csv                    Pandas DataFrame
                 .csv.gz                 Pandas DataFrame
+                .parquet                Pandas DataFrame
                 .json                   JSON
                 .npy                    Numpy Array
         
             Support for additional formats will be added as needed.
 
         """        
-        return self._io.read(self._path, filter)
+        handler = self._handler or _get_file_handler(self._fileext)
+        return handler.read(self._path, filter, **kwargs)
+
+    def read_bytes(self, limit=None):
+        """Returns the raw contents of the file as bytes.
 
-    def write(self, content):
+        The file is read with unbuffered os.read calls, regardless of its
+        format, and no file handler is required.
+
+        Parameters
+        ----------
+        limit : int (Optional)
+            The maximum number of bytes to read.
+
+        Returns
+        -------
+        bytes : The file contents. Returns None if unable to read the file.
+
+        """
+        try:
+            return _read_bytes(self._path, limit)
+        except OSError as e:
+            print(e)
+            return None
+
+    def write(self, content, **kwargs):
         """Writes content to file.
 
         The format of the content must correspond with the file type. The 
@@ -219,11 +597,199 @@ class File:
         Numpy Array         .npy
         JSON                .json
 
+        Format specific write options, such as 'index' for CSV files, are
+        passed to the file handler as keyword arguments.
+
+        Raises
+        ------
+        FileLockedError if the file is locked.
+
         """
-        if self._is_unlocked(self._path, 'write'):            
-            self._io.write(self._path, content)
+        if self._locked:
+            raise FileLockedError(self._path)
+        handler = self._handler or _get_file_handler(self._fileext)
+        handler.write(self._path, content, **kwargs)
+        self._stat = False
 
 
+# Record layout of the FileGroup.print summary. Strings are held as objects
+# so that long paths are not truncated.
+_FILEGROUP_DTYPE = [('Class', 'O'), ('Name', 'O'), ('Path', 'O'), 
+                    ('Exists', '?'), ('Size', 'i8'), 
+                    ('Modified', 'datetime64[s]')]
+
+# ---------------------------------------------------------------------------- #
+#                                  FileGroup                                   #   
+# ---------------------------------------------------------------------------- #
+class FileGroup:
+    """A named collection of File objects, keyed by File name.
+
+    Files passed to add are keyed by their File name, which defaults to
+    the filename root, e.g. 'san_francisco'. Files added by add_directory
+    or from_directory are keyed by their full filename, e.g. 
+    'san_francisco.csv', so that files sharing a root do not collide. Use
+    the matching key with get and remove; a file added both ways is held
+    under both keys.
+
+    Parameters
+    ----------
+    name : str
+        The name of the FileGroup.
+
+    """
+
+    __slots__ = ('_name', '_file_objects')
+
+    def __init__(self, name):
+        self._name = name
+        self._file_objects = OrderedDict()
+
+    def __len__(self):
+        return len(self._file_objects)
+
+    @property
+    def name(self):
+        """Returns the name of the FileGroup."""
+        return self._name
+
+    def add(self, file):
+        """Adds a File object to the FileGroup.
+
+        Parameters
+        ----------
+        file : File
+            The File object to add.
+
+        Raises
+        ------
+        KeyError if a File with the same name is already in the FileGroup.
+
+        """
+        if file.name in self._file_objects:
+            raise KeyError("Unable to add {name}. The name already exists."\
+                .format(name=file.name))
+        self._file_objects[file.name] = file
+
+    def add_directory(self, directory, file_ext=None):
+        """Adds a File object for each file in a directory.
+
+        The directory is listed once with os.scandir, and regular files are
+        identified from the listing. Each File is built with 
+        File.from_direntry, so no file is stat'ed until its size, mtime or
+        existence is queried. Files are named by their filename, extension 
+        included, so that files sharing a root do not collide.
+
+        Parameters
+        ----------
+        directory : str
+            The directory whose files are added. Subdirectories are skipped.
+        file_ext : str (Optional)
+            Only files with this extension, e.g. '.csv', are added. The
+            extension is matched without regard to case.
+
+        Raises
+        ------
+        KeyError if a File with the same name is already in the FileGroup.
+
+        """
+        if file_ext is not None:
+            file_ext = file_ext.lower()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if file_ext is not None and \
+                    not entry.name.lower().endswith(file_ext):
+                    continue
+                self.add(File.from_direntry(entry))
+
+    @classmethod
+    def from_directory(cls, directory, file_ext=None, name=None):
+        """Returns a FileGroup of the files in a directory.
+
+        Parameters
+        ----------
+        directory : str
+            The directory whose files are added. Subdirectories are skipped.
+        file_ext : str (Optional)
+            Only files with this extension, e.g. '.csv', are added.
+        name : str (Optional)
+            The name of the FileGroup. Defaults to the directory name.
+
+        """
+        group = cls(name or os.path.basename(os.path.normpath(directory)))
+        group.add_directory(directory, file_ext)
+        return group
+
+    def get(self, name):
+        """Returns the File object with the given name, or None if not found."""
+        file = self._file_objects.get(name)
+        if file is None:
+            print("The file, {name}, is not in the group. None returned."\
+                .format(name=name))
+        return file
+
+    def remove(self, name):
+        """Removes the File object with the given name.
+
+        No exception is thrown if the File object does not exist.
+        """
+        if self._file_objects.pop(name, None) is None:
+            print("The file, {name}, is not in the group. Nothing removed."\
+                .format(name=name))
+
+    def read_all(self, filter=None, max_workers=None, use_processes=False):
+        """Reads every file in the group concurrently.
+
+        Reads run on a thread pool by default; pandas and pyarrow release 
+        the GIL while reading and parsing. When parsing in Python dominates,
+        'use_processes' reads in worker processes instead, each limited to 
+        a single pyarrow thread.
+
+        Parameters
+        ----------
+        filter : array like (Optional)
+            Specifies specific columns to read from each file.
+        max_workers : int (Optional)
+            The maximum number of concurrent reads. Defaults to the number
+            of CPUs.
+        use_processes : bool
+            Read in a process pool rather than a thread pool.
+
+        Returns
+        -------
+        dict : Maps each File name to its contents.
+
+        """
+        paths = [fo.path for fo in self._file_objects.values()]
+        results = read_many(paths, filter, max_workers, use_processes)
+        return dict(zip(self._file_objects, results))
+
+    def print(self):
+        """Prints and returns a summary of the File objects in the group.
+
+        Each File is stat'ed at most once. Rows are written by index into a
+        preallocated structured array, which becomes the DataFrame.
+
+        Returns
+        -------
+        DataFrame : One row per File with its class, name, path, whether
+                    it exists, its size in bytes and when it was modified.
+
+        """
+        rows = np.empty(len(self._file_objects), dtype=_FILEGROUP_DTYPE)
+        for i, (name, fo) in enumerate(self._file_objects.items()):
+            st = fo._get_stat()
+            if st is not None:
+                rows[i] = (type(fo).__name__, name, fo.path, True, 
+                           st.st_size, np.datetime64(int(st.st_mtime), 's'))
+            else:
+                rows[i] = (type(fo).__name__, name, fo.path, False, 0,
+                           np.datetime64('NaT'))
+        df = pd.DataFrame(rows)
+        print(df.to_string(index=False))
+        return df
+
 # ---------------------------------------------------------------------------- #
 #                            FileIOStrategy                                    #  
 # ---------------------------------------------------------------------------- #
@@ -232,6 +798,56 @@ class FileIOStrategy(ABC):
 
     @abstractmethod
     def read(self, path, filter=None):
+        """Reads the file designated by 'path'.
+
+        The CSV readers accept the keyword arguments below after 'filter'.
+        Passing both 'filter' and 'dtype' is the fastest way to read: the
+        parser skips unrequested columns entirely, and the pandas parser
+        converts the rest with typed converters rather than inferring 
+        their types.
+
+        Parameters
+        ----------
+        path : str
+            The relative or fully qualified file path
+        filter : list
+            A list of column names to return in the result
+        row_filter : pyarrow.compute.Expression (Optional)
+            Rows for which the expression is False are discarded during 
+            the scan, e.g. pyarrow.dataset.field('price') > 100. Requires 
+            pyarrow.
+        dtype : dict (Optional)
+            Maps column names to dtypes, e.g. {'room_type': 'category'}. 
+            Low cardinality string columns stored as 'category' use a 
+            fraction of the memory of object columns.
+        parse_dates : list (Optional)
+            Names of columns to be parsed as datetimes. Other columns of
+            dates are returned as strings by every parser.
+        categories : list (Optional)
+            Names of columns to be converted to 'category' after the read.
+        dtype_backend : str (Optional)
+            Set to 'pyarrow' for DataFrames backed by Arrow arrays. Ignored
+            by versions of pandas without Arrow backed dtypes.
+        post_process : dict (Optional)
+            Maps numeric column names to kernels applied after the read. 
+            Each kernel receives the column as a contiguous numpy array and 
+            returns an array of the same length, e.g. a numba.njit function.
+        as_frame : bool (Optional)
+            If False, a pyarrow Table is returned without conversion to a
+            DataFrame, and dtype, parse_dates, categories, dtype_backend
+            and post_process are ignored. Dates keep the types pyarrow 
+            infers. Requires pyarrow.
+        chunksize : int (Optional)
+            If given, an iterator is returned that yields DataFrames of up
+            to 'chunksize' rows, parsed as they are consumed, so that only 
+            one chunk is held in memory. The dtype and other hints are 
+            applied to each chunk. Ignored with row_filter or as_frame=False.
+        engine : str (Optional)
+            Set to 'pandas' to parse with the pandas C parser rather than 
+            the multi-threaded pyarrow parser, e.g. for dtypes pyarrow does
+            not convert. Ignored with row_filter or as_frame=False.
+
+        """
         pass
 
     @abstractmethod
@@ -240,17 +856,110 @@ class FileIOStrategy(ABC):
 
     
     def _check_dir(self, path):
-        """Checks existence of a files directory and creates if not exists."""
+        """Creates the file's directory, and any parents, if not exists."""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+    def _format_filter(self, filter):
+        """Returns the column filter as a list without duplicates.
+
+        Every reader returns the columns in the order of the filter.
+        """
+        if filter is not None:
+            filter = list(dict.fromkeys(filter))
+        return filter
+
+    def _read_dataset(self, path, filter, row_filter, dtype=None,
+                      dtype_backend=None):
+        """Reads the rows matching 'row_filter' via a pyarrow dataset scan."""
+        table = _temporal_as_strings(self._scan_table(path, filter, row_filter))
+        result = table.to_pandas(types_mapper=_types_mapper(dtype_backend))
+        return result.astype(dtype) if dtype else result
+
+    def _scan_table(self, path, filter=None, row_filter=None):
+        """Returns the rows matching 'row_filter' as an Arrow table."""
+        if pa is None:
+            raise ImportError("pyarrow is required to read with a row_filter.")
+        columns = list(filter) if filter is not None else None
+        dataset = pa.dataset.dataset(path, format='csv')
+        return dataset.to_table(columns=columns, filter=row_filter)
+
+    def _read_table(self, source, filter=None):
+        """Parses CSV from a path or stream into an Arrow table.
+
+        Columns not in 'filter' are skipped during the parse.
+        """
+        if pa is None:
+            raise ImportError("pyarrow is required to read an Arrow table.")
+        read_options = pa.csv.ReadOptions(use_threads=True,
+                                          block_size=_ARROW_BLOCK_SIZE)
+        convert_options = pa.csv.ConvertOptions()
+        if filter is not None:
+            convert_options.include_columns = list(filter)
+        return pa.csv.read_csv(source, read_options=read_options,
+                               convert_options=convert_options)
+
+    def _read_arrow(self, source, filter=None, dtype=None, dtype_backend=None):
+        """Parses CSV from a path or stream with the pyarrow CSV reader.
+
+        Columns not in 'filter' are skipped during the parse. The Arrow
+        buffers are released column by column as the DataFrame is built.
+        """
+        table = _temporal_as_strings(self._read_table(source, filter))
+        result = table.to_pandas(split_blocks=True, self_destruct=True,
+                                 types_mapper=_types_mapper(dtype_backend))
+        return result.astype(dtype) if dtype else result
+
+    def _open(self, path):
+        """Opens 'path' for buffered binary reading."""
+        return open(path, 'rb', buffering=_READ_BUFFER)
+
+    def _read_chunks(self, f, chunksize, filter=None, dtype=None,
+                     dtype_backend=None, parse_dates=None, categories=None,
+                     post_process=None):
+        """Yields DataFrames of up to 'chunksize' rows parsed from 'f'.
+
+        The file object is closed when the iterator is exhausted or closed.
+        """
+        with f:
+            for chunk in _read_csv(f, dtype_backend, usecols=filter, 
+                                   dtype=dtype, chunksize=chunksize, 
+                                   engine='c'):
+                if filter is not None:
+                    chunk = chunk[filter]
+                yield self._apply_hints(chunk, parse_dates, categories,
+                                        post_process)
+
+    def _apply_hints(self, result, parse_dates=None, categories=None,
+                     post_process=None):
+        """Parses dates, converts categories and runs kernels after a read."""
+        for column in parse_dates or ():
+            if not pd.api.types.is_datetime64_any_dtype(result[column]):
+                result[column] = pd.to_datetime(result[column])
+        if categories:
+            result = result.astype({column: 'category' for column in categories})
+        for column, kernel in (post_process or {}).items():
+            values = np.ascontiguousarray(result[column].to_numpy())
+            result[column] = kernel(values)
+        return result
 
-        directory = os.path.dirname(path)
-        if not os.path.exists(directory):
-            os.mkdir(directory)    
-            print("Directory did not exist. \
-                Created {dirname}.".format(dirname=directory))
+    def _write_arrow(self, table, sink):
+        """Writes an Arrow table as CSV to a path or stream in batches."""
+        write_options = pa.csv.WriteOptions(batch_size=_ARROW_WRITE_BATCH)
+        pa.csv.write_csv(table, sink, write_options=write_options)
 
-    def _check_file_ext(self, path, ext):
-        """Ensures file extension is correct."""
-        if not os.path.splitext(path)[1] == ext:
+    def _to_arrow(self, content, index=False):
+        """Returns a DataFrame as an Arrow table or None if not convertible."""
+        if pa is None or not isinstance(content, pd.DataFrame):
+            return None
+        try:
+            return pa.Table.from_pandas(content, preserve_index=index)
+        except pa.ArrowException:
+            return None
+
+    @staticmethod
+    def _check_file_ext(path, ext):
+        """Ensures file extension is correct, without regard to case."""
+        if not path.lower().endswith(ext):
             new_path = path + ext
             print("File extension incompatible with file type.\
                 Saving {oldname} as {newname}.".format(
@@ -259,22 +968,30 @@ class FileIOStrategy(ABC):
             return new_path
         return path
         
-#         
 # ---------------------------------------------------------------------------- #
-#                               FilEIOCSVgz                                    #  
+#                            _FileIOCSVStrategy                                #  
 # ---------------------------------------------------------------------------- #
-class FileIOCSVgz(FileIOStrategy):
-    """Read and write .gz compressed CSV files into and from DataFrame objects."""
+class _FileIOCSVStrategy(FileIOStrategy):
+    """Base class for the CSV strategies, which share one read dispatch.
+
+    Subclasses implement the format specific parts: _open, _read_pandas,
+    _read_source_table, which parses the file into an Arrow table, and 
+    _read_default, the reader used when pyarrow is installed.
+    """
+
+    def read(self, path, filter=None, row_filter=None, dtype=None,
+             parse_dates=None, categories=None, dtype_backend=None,
+             post_process=None, as_frame=True, chunksize=None, engine=None):
+        """Reads a CSV file, designated by 'path' into a DataFrame.
+
+        See FileIOStrategy.read for the keyword arguments after 'filter'.
 
-    def read(self, path, filter=None):
-        """Reads a .gz file, designated by 'path' into a DataFrame.
-        
         Parameters
         ----------
         path : str
             The relative or fully qualified file path
         filter : list
-            A list of the column names to include in the result. 
+            A list of column names to return in the result
 
         Returns
         -------
@@ -282,10 +999,26 @@ class FileIOCSVgz(FileIOStrategy):
                     unable to read the file.
         
         """
-        
+        filter = self._format_filter(filter)
         try:
-            result = pd.read_csv(path, compression='gzip', error_bad_lines=False,
-                        low_memory=False, usecols=filter)
+            if not as_frame:
+                if row_filter is not None:
+                    return self._scan_table(path, filter, row_filter)
+                return self._read_source_table(path, filter)
+            if row_filter is None and chunksize:
+                # Opened here so that a missing file is reported now
+                return self._read_chunks(self._open(path), chunksize, filter,
+                                         dtype, dtype_backend, parse_dates,
+                                         categories, post_process)
+            if row_filter is not None:
+                result = self._read_dataset(path, filter, row_filter, dtype,
+                                            dtype_backend)
+            elif pa is None or engine == 'pandas':
+                result = self._read_pandas(path, filter, dtype, dtype_backend)
+            else:
+                result = self._read_default(path, filter, dtype, dtype_backend)
+            result = self._apply_hints(result, parse_dates, categories,
+                                       post_process)
         except IOError:
             print("The file, {fname}, does not exist. None returned.".format(fname=path))
             result = None
@@ -294,7 +1027,86 @@ class FileIOCSVgz(FileIOStrategy):
             result = None
         return result
 
-    def write(self, path, content):
+    @abstractmethod
+    def _read_source_table(self, path, filter=None):
+        pass
+
+    @abstractmethod
+    def _read_default(self, path, filter=None, dtype=None, dtype_backend=None):
+        pass
+
+    @abstractmethod
+    def _read_pandas(self, path, filter=None, dtype=None, dtype_backend=None):
+        pass
+
+#         
+# ---------------------------------------------------------------------------- #
+#                               FilEIOCSVgz                                    #  
+# ---------------------------------------------------------------------------- #
+class FileIOCSVgz(_FileIOCSVStrategy):
+    """Read and write .gz compressed CSV files into and from DataFrame objects."""
+
+    def _read_source_table(self, path, filter=None):
+        """Parses the decompressed stream of 'path' into an Arrow table."""
+        if pa is None:
+            raise ImportError("pyarrow is required to read an Arrow table.")
+        with pa.CompressedInputStream(pa.OSFile(path, 'rb'), 'gzip') as source:
+            return self._read_table(source, filter)
+
+    def _read_default(self, path, filter=None, dtype=None, dtype_backend=None):
+        """Reads large files with the streaming reader, others in one pass."""
+        if os.path.getsize(path) > _LARGE_GZ_BYTES:
+            return self._read_stream(path, filter, dtype, dtype_backend)
+        return self._read_gzip(path, filter, dtype, dtype_backend)
+
+    def _open(self, path):
+        """Opens 'path' for buffered reading of the decompressed bytes."""
+        return io.BufferedReader(gzip.open(path, 'rb'), 
+                                 buffer_size=_GZIP_READ_BUFFER)
+
+    def _read_gzip(self, path, filter=None, dtype=None, dtype_backend=None):
+        """Reads a .gz file with the pyarrow reader, falling back to pandas."""
+        try:
+            with pa.CompressedInputStream(pa.OSFile(path, 'rb'), 'gzip') as source:
+                return self._read_arrow(source, filter, dtype, dtype_backend)
+        except pa.ArrowException:
+            return self._read_pandas(path, filter, dtype, dtype_backend)
+
+    def _read_pandas(self, path, filter=None, dtype=None, dtype_backend=None):
+        """Reads a .gz file with the pandas C parser.
+
+        Without dtypes the file is parsed in one pass so that types are
+        inferred across all rows; with dtypes it is parsed in chunks.
+        """
+        with gzip.open(path, 'rb') as gz, \
+            io.BufferedReader(gz, buffer_size=_GZIP_READ_BUFFER) as f:
+            result = _read_csv(f, dtype_backend, on_bad_lines='skip', 
+                               low_memory=bool(dtype), usecols=filter, 
+                               dtype=dtype, engine='c')
+        # usecols returns the columns in file order
+        return result[filter] if filter is not None else result
+
+    def _read_stream(self, path, filter=None, dtype=None, dtype_backend=None):
+        """Reads a large .gz file with the pyarrow streaming CSV reader.
+
+        Gzip decompression runs in the calling thread while tokenizing and
+        conversion of completed blocks run on pyarrow's thread pool. When
+        indexed_gzip is installed it is used as the decompressor.
+        """
+        if indexed_gzip is not None:
+            source = pa.PythonFile(indexed_gzip.IndexedGzipFile(path), mode='r')
+        else:
+            source = pa.CompressedInputStream(pa.OSFile(path, 'rb'), 'gzip')
+        convert_options = pa.csv.ConvertOptions()
+        if filter is not None:
+            convert_options.include_columns = list(filter)
+        with source:
+            reader = pa.csv.open_csv(source, convert_options=convert_options)
+            result = _temporal_as_strings(reader.read_all()).to_pandas(
+                types_mapper=_types_mapper(dtype_backend))
+        return result.astype(dtype) if dtype else result
+
+    def write(self, path, content, index=False, compresslevel=_GZIP_LEVEL):
         """Accepts a path and a DataFrame and writes it to a .csv.gz file.
         
         Parameters
@@ -303,6 +1115,12 @@ class FileIOCSVgz(FileIOStrategy):
             The relative or fully qualified file path
         content : DataFrame
             The content to be written to file.
+        index : bool (Optional)
+            Whether to write the DataFrame index as a column. Defaults to
+            False.
+        compresslevel : int (Optional)
+            The gzip compression level, from 1 (fastest) to 9 (smallest).
+            Defaults to 1.
 
         Returns
         -------
@@ -315,7 +1133,15 @@ class FileIOCSVgz(FileIOStrategy):
         self._check_dir(path)
         path = self._check_file_ext(path, '.gz')
         try:
-            content.to_csv(path, compression='gzip', index=False)
+            table = self._to_arrow(content, index)
+            with open(path, 'wb', buffering=_WRITE_BUFFER) as f, \
+                gzip.GzipFile(fileobj=f, mode='wb', 
+                              compresslevel=compresslevel) as sink:
+                if table is not None:
+                    self._write_arrow(table, sink)
+                else:
+                    content.to_csv(sink, mode='wb', index=index,
+                                   chunksize=_PANDAS_WRITE_CHUNK)
         except Exception as e:
             print(e)
             path = None
@@ -325,12 +1151,93 @@ class FileIOCSVgz(FileIOStrategy):
 # ---------------------------------------------------------------------------- #
 #                               FileIOCSV                                      #  
 # ---------------------------------------------------------------------------- #
-class FileIOCSV(FileIOStrategy):
+class FileIOCSV(_FileIOCSVStrategy):
     """Read and write CSV files and returning DataFrames."""
 
-    def read(self, path, filter=None):
-        """Reads a .csv file, designated by 'path' into a DataFrame.
+    def _read_source_table(self, path, filter=None):
+        """Parses the file at 'path' into an Arrow table."""
+        return self._read_table(path, filter)
+
+    def _read_default(self, path, filter=None, dtype=None, dtype_backend=None):
+        """Reads with the pyarrow reader, falling back to pandas."""
+        try:
+            return self._read_arrow(path, filter, dtype, dtype_backend)
+        except pa.ArrowException:
+            return self._read_pandas(path, filter, dtype, dtype_backend)
+
+    def _read_pandas(self, path, filter=None, dtype=None, dtype_backend=None):
+        """Reads a .csv file with the pandas C parser.
+
+        The file is memory mapped, so the parser reads from the page cache
+        without copying through a read buffer. Without dtypes the file is
+        parsed in one pass so that types are inferred across all rows; 
+        with dtypes it is parsed in chunks.
+        """
+        result = _read_csv(path, dtype_backend, usecols=filter, dtype=dtype,
+                           low_memory=bool(dtype), engine='c', 
+                           memory_map=True)
+        # usecols returns the columns in file order
+        return result[filter] if filter is not None else result
+
+    def write(self, path, content, index=False):
+        """Accepts a filename and a DataFrame and writes it to a .csv file.
         
+        Parameters
+        ----------
+        path : str
+            The relative or fully qualified file path
+        content : DataFrame
+            The DataFrame object to be written to file.
+        index : bool (Optional)
+            Whether to write the DataFrame index as a column. Defaults to
+            False.
+
+        Returns
+        -------
+        str
+            If successful, the method returns the path to which the file was
+            written.  If unsuccessful, None is returned.
+
+        """
+
+        self._check_dir(path)
+        path = self._check_file_ext(path, '.csv')
+        try:
+            table = self._to_arrow(content, index)
+            if table is not None:
+                # The pyarrow writer writes whole batches to a native stream
+                self._write_arrow(table, path)
+            else:
+                with open(path, 'wb', buffering=_WRITE_BUFFER) as f:
+                    content.to_csv(f, mode='wb', index=index, 
+                                   chunksize=_PANDAS_WRITE_CHUNK)
+        except Exception as e:
+            print(e)
+            path = None
+        return path
+        
+# ---------------------------------------------------------------------------- #
+#                              _PolarsCSVReader                                #  
+# ---------------------------------------------------------------------------- #
+class _PolarsCSVReader:
+    """Mixin reading CSV files with the multithreaded Polars reader.
+
+    Mixed in ahead of a CSV strategy, whose read method is used for the
+    reads Polars does not handle and for files Polars fails to parse.
+    """
+
+    def read(self, path, filter=None, row_filter=None, dtype=None,
+             parse_dates=None, categories=None, dtype_backend=None,
+             post_process=None, as_frame=True, chunksize=None, engine=None):
+        """Reads a CSV file, designated by 'path' into a DataFrame.
+
+        Columns not included in 'filter' are skipped during tokenization.
+        Polars detects gzip compression from the file contents. Files 
+        Polars fails to parse are read with the pyarrow reader, or pandas
+        when pyarrow is not installed.
+
+        See FileIOStrategy.read for the keyword arguments after 'filter'.
+
         Parameters
         ----------
         path : str
@@ -344,8 +1251,86 @@ class FileIOCSV(FileIOStrategy):
                     unable to read the file.
         
         """
+        if row_filter is not None or not as_frame or chunksize or engine:
+            return super().read(path, filter, row_filter, dtype, parse_dates,
+                                categories, dtype_backend, post_process,
+                                as_frame, chunksize, engine)
+        filter = self._format_filter(filter)
         try:
-            result = pd.read_csv(path, usecols=filter, low_memory=False)
+            # Converted through Arrow so that dtype_backend is respected
+            result = pl.read_csv(path, columns=filter, low_memory=False)\
+                .to_arrow().to_pandas(
+                    types_mapper=_types_mapper(dtype_backend))
+            if filter is not None:
+                result = result[filter]
+            if dtype:
+                result = result.astype(dtype)
+            result = self._apply_hints(result, parse_dates, categories,
+                                       post_process)
+        except IOError:
+            print("The file, {fname}, does not exist. None returned.".format(fname=path))
+            result = None
+        except Exception:
+            # Fall back to the pyarrow, then pandas, readers of the base class
+            result = super().read(path, filter, row_filter, dtype, parse_dates,
+                                  categories, dtype_backend, post_process,
+                                  as_frame, chunksize, engine)
+        return result
+
+# ---------------------------------------------------------------------------- #
+#                             FileIOCSVPolars                                  #  
+# ---------------------------------------------------------------------------- #
+class FileIOCSVPolars(_PolarsCSVReader, FileIOCSV):
+    """Reads CSV files with the multithreaded Polars reader."""
+
+# ---------------------------------------------------------------------------- #
+#                            FileIOCSVgzPolars                                 #  
+# ---------------------------------------------------------------------------- #
+class FileIOCSVgzPolars(_PolarsCSVReader, FileIOCSVgz):
+    """Reads .gz compressed CSV files with the multithreaded Polars reader."""
+
+# ---------------------------------------------------------------------------- #
+#                               FileIOParquet                                  #  
+# ---------------------------------------------------------------------------- #
+class FileIOParquet(FileIOStrategy):
+    """Read and write Parquet files and returning DataFrames."""
+
+    def read(self, path, filter=None, dtype=None, as_frame=True):
+        """Reads a .parquet file, designated by 'path' into a DataFrame.
+
+        Only the column chunks named in 'filter' are read from disk.
+        
+        Parameters
+        ----------
+        path : str
+            The relative or fully qualified file path
+        filter : list
+            A list of column names to return in the result
+        dtype : dict (Optional)
+            Maps column names to the dtypes to which they are cast.
+        as_frame : bool (Optional)
+            If False, the pyarrow Table is returned without conversion to a
+            DataFrame and dtype is ignored. Requires pyarrow.
+
+        Returns
+        -------
+        DataFrame : The file contents in DataFrame format. Returns None if 
+                    unable to read the file.
+        
+        """
+        columns = list(filter) if filter is not None else None
+        try:
+            if not as_frame and pa is None:
+                raise ImportError("pyarrow is required to read an Arrow table.")
+            if pa is not None:
+                table = pa.parquet.read_table(path, columns=columns)
+                if not as_frame:
+                    return table
+                result = table.to_pandas(split_blocks=True, self_destruct=True)
+            else:
+                result = pd.read_parquet(path, columns=columns)
+            if dtype:
+                result = result.astype(dtype)
         except IOError:
             print("The file, {fname}, does not exist. None returned.".format(fname=path))
             result = None
@@ -355,7 +1340,10 @@ class FileIOCSV(FileIOStrategy):
         return result
 
     def write(self, path, content):
-        """Accepts a filename and a DataFrame and writes it to a .csv file.
+        """Accepts a filename and a DataFrame and writes it to a .parquet file.
+
+        The file is compressed with Zstandard and string columns are 
+        dictionary encoded.
         
         Parameters
         ----------
@@ -373,14 +1361,108 @@ class FileIOCSV(FileIOStrategy):
         """
 
         self._check_dir(path)
-        path = self._check_file_ext(path, '.csv')
+        path = self._check_file_ext(path, '.parquet')
         try:
-            content.to_csv(path, index=False)
+            table = self._to_arrow(content)
+            if table is not None:
+                pa.parquet.write_table(table, path, compression='zstd',
+                                       use_dictionary=True)
+            else:
+                content.to_parquet(path, compression='zstd', index=False)
         except Exception as e:
             print(e)
             path = None
         return path
+
+# ---------------------------------------------------------------------------- #
+#                               FileIOFeather                                  #  
+# ---------------------------------------------------------------------------- #
+class FileIOFeather(FileIOStrategy):
+    """Read and write Feather files and returning DataFrames."""
+
+    def read(self, path, filter=None, dtype=None, as_frame=True):
+        """Reads a .feather file, designated by 'path' into a DataFrame.
+
+        The file is memory mapped and only the columns named in 'filter' 
+        are materialized.
         
+        Parameters
+        ----------
+        path : str
+            The relative or fully qualified file path
+        filter : list
+            A list of column names to return in the result
+        dtype : dict (Optional)
+            Maps column names to the dtypes to which they are cast.
+        as_frame : bool (Optional)
+            If False, the pyarrow Table is returned without conversion to a
+            DataFrame and dtype is ignored. Requires pyarrow.
+
+        Returns
+        -------
+        DataFrame : The file contents in DataFrame format. Returns None if 
+                    unable to read the file.
+        
+        """
+        columns = list(filter) if filter is not None else None
+        try:
+            if not as_frame and pa is None:
+                raise ImportError("pyarrow is required to read an Arrow table.")
+            if pa is not None:
+                table = pa.feather.read_table(path, columns=columns, 
+                                              memory_map=True)
+                if not as_frame:
+                    return table
+                result = table.to_pandas(split_blocks=True, self_destruct=True)
+            else:
+                result = pd.read_feather(path, columns=columns)
+            if dtype:
+                result = result.astype(dtype)
+        except IOError:
+            print("The file, {fname}, does not exist. None returned.".format(fname=path))
+            result = None
+        except Exception as e:
+            print(e)
+            result = None
+        return result
+
+    def write(self, path, content, compression='zstd'):
+        """Accepts a filename and a DataFrame and writes it to a .feather file.
+
+        The file is compressed with Zstandard by default.
+        
+        Parameters
+        ----------
+        path : str
+            The relative or fully qualified file path
+        content : DataFrame
+            The DataFrame object to be written to file.
+        compression : str (Optional)
+            'zstd', 'lz4' or 'uncompressed'. Uncompressed files are memory 
+            mapped by read without copying the column buffers.
+
+        Returns
+        -------
+        str
+            If successful, the method returns the path to which the file was
+            written.  If unsuccessful, None is returned.
+
+        """
+
+        self._check_dir(path)
+        path = self._check_file_ext(path, '.feather')
+        try:
+            table = self._to_arrow(content)
+            if table is not None:
+                pa.feather.write_feather(table, path, compression=compression)
+            else:
+                content.reset_index(drop=True).to_feather(
+                    path, compression=compression)
+        except Exception as e:
+            print(e)
+            path = None
+        return path
+
 # ---------------------------------------------------------------------------- #
 #                               FileIOExcel                                    #  
 # ---------------------------------------------------------------------------- #
@@ -446,14 +1528,17 @@ class FileIOTXT(FileIOStrategy):
     """Read and write TXT files, returning strings."""
 
     def read(self, path, filter=None):
-        """Reads a .txt file, designated by 'path' into a DataFrame.
+        """Reads a .txt file, designated by 'path' into a string.
+
+        The whole file is read with a single os.read sized by fstat, and 
+        decoded as UTF-8 with universal newlines.
         
         Parameters
         ----------
         path : str
             The relative or fully qualified file path
-        filter : list
-            The number of bytes to read
+        filter : int
+            The number of characters to read
 
         Returns
         -------
@@ -462,8 +1547,13 @@ class FileIOTXT(FileIOStrategy):
         
         """
         try:
-            f = open(path, 'r')
-            result = f.read(filter)
+            if filter is not None:
+                # The limit counts characters, so the text layer is used
+                with open(path, 'r', encoding='utf-8') as f:
+                    return f.read(filter)
+            result = _read_bytes(path).decode('utf-8')
+            if '\r' in result:
+                result = result.replace('\r\n', '\n').replace('\r', '\n')
         except IOError:
             print("The file, {fname}, does not exist. None returned.".format(fname=path))
             result = None
@@ -499,43 +1589,342 @@ class FileIOTXT(FileIOStrategy):
         self._check_dir(path)
         path = self._check_file_ext(path, '.txt')
         try:
-            f = open(path, 'w')
-            if isinstance(content, str):                
-                f.write(content)
+            with open(path, 'w') as f:
+                if isinstance(content, str):                
+                    f.write(content)
+                else:
+                    f.writelines(content)
+        except Exception as e:
+            print(e)
+            path = None
+        return path
+
+# ---------------------------------------------------------------------------- #
+#                               FileIOJSON                                     #  
+# ---------------------------------------------------------------------------- #
+class FileIOJSON(FileIOStrategy):
+    """Read and write JSON files."""
+
+    def read(self, path, filter=None):
+        """Reads a .json file, designated by 'path' into Python objects.
+
+        The file is read with a single os.read sized by fstat and parsed
+        from the bytes, without a buffered text stream.
+        
+        Parameters
+        ----------
+        path : str
+            The relative or fully qualified file path
+        filter : list (Optional)
+            If the file holds a JSON object, the keys to return.
+
+        Returns
+        -------
+        dict or list : The parsed file contents. Returns None if unable to 
+                       read the file.
+        
+        """
+        try:
+            result = json.loads(_read_bytes(path))
+            if filter is not None and isinstance(result, dict):
+                result = {k: result[k] for k in filter if k in result}
+        except IOError:
+            print("The file, {fname}, does not exist. None returned.".format(fname=path))
+            result = None
+        except Exception as e:
+            print(e)
+            result = None
+        return result
+
+    def write(self, path, content):
+        """Accepts a filename and JSON serializable content and writes it.
+        
+        Parameters
+        ----------
+        path : str
+            The relative or fully qualified file path
+        content : dict or list
+            The JSON serializable content to be written to file.
+
+        Returns
+        -------
+        str
+            If successful, the method returns the path to which the file was
+            written.  If unsuccessful, None is returned.
+
+        """
+
+        self._check_dir(path)
+        path = self._check_file_ext(path, '.json')
+        try:
+            data = json.dumps(content).encode('utf-8')
+            with open(path, 'wb', buffering=0) as f:
+                f.write(data)
+        except Exception as e:
+            print(e)
+            path = None
+        return path
+
+
+# ---------------------------------------------------------------------------- #
+#                               FileIONumpy                                    #  
+# ---------------------------------------------------------------------------- #
+class FileIONumpy(FileIOStrategy):
+    """Read and write .npy and .npz files, returning numpy arrays."""
+
+    def read(self, path, filter=None, mmap=None):
+        """Reads a .npy or .npz file, designated by 'path'.
+        
+        Parameters
+        ----------
+        path : str
+            The relative or fully qualified file path
+        filter : list (Optional)
+            For .npz files, the names of the arrays to return. Ignored for 
+            .npy files.
+        mmap : bool (Optional)
+            If True, a .npy file is memory mapped read-only, so only the 
+            pages touched are read from disk. Defaults to True for files
+            larger than 64 MiB. Memory mapped arrays must not be modified;
+            call copy() on the result for a writable array.
+
+        Returns
+        -------
+        ndarray : The array for a .npy file.
+        NpzFile or dict : For a .npz file, the lazily loaded archive, or a 
+                          dict of the arrays in 'filter'. 
+        Returns None if unable to read the file.
+        
+        """
+        try:
+            if os.path.splitext(path)[1] == '.npz':
+                result = np.load(path, allow_pickle=False)
+                if filter is not None:
+                    with result:
+                        result = {name: result[name] for name in filter}
             else:
-                for string in content:
-                    f.writelines(string)
+                if mmap is None:
+                    mmap = os.path.getsize(path) > _LARGE_NPY_BYTES
+                result = np.load(path, mmap_mode='r' if mmap else None,
+                                 allow_pickle=False)
+        except IOError:
+            print("The file, {fname}, does not exist. None returned.".format(fname=path))
+            result = None
+        except Exception as e:
+            print(e)
+            result = None
+        return result
+
+    def write(self, path, content, compress=False):
+        """Writes an array to a .npy file, or a dict of arrays to a .npz file.
+
+        Each array in a dict is stored as a named, natively typed entry.
+        
+        Parameters
+        ----------
+        path : str
+            The relative or fully qualified file path
+        content : ndarray or dict
+            The array, or dict mapping names to arrays, to be written.
+        compress : bool (Optional)
+            If True, .npz archives are deflate compressed. Suited to data
+            that is rarely read. Defaults to False.
+
+        Returns
+        -------
+        str
+            If successful, the method returns the path to which the file was
+            written.  If unsuccessful, None is returned.
+
+        """
+
+        self._check_dir(path)
+        try:
+            if isinstance(content, dict):
+                path = self._check_file_ext(path, '.npz')
+                savez = np.savez_compressed if compress else np.savez
+                savez(path, **content)
+            else:
+                path = self._check_file_ext(path, '.npy')
+                np.save(path, content, allow_pickle=False)
         except Exception as e:
             print(e)
             path = None
         return path
 
+# ---------------------------------------------------------------------------- #
+#                               FILE HANDLERS                                  #     
+# ---------------------------------------------------------------------------- #
+# File handlers are stateless, so a single instance per extension is shared
+# by all File and FileIO objects.
+_FILE_HANDLERS = {'.gz': FileIOCSVgz(), '.csv': FileIOCSV(),
+                  '.parquet': FileIOParquet(), '.feather': FileIOFeather(),
+                  '.xlsx': FileIOExcel(), 
+                  '.txt': FileIOTXT(), '.json': FileIOJSON(),
+                  '.npy': FileIONumpy(), 
+                  '.npz': FileIONumpy()}
+if pl is not None and os.environ.get('DATASTUDIO_FAST_IO') == '1':
+    _FILE_HANDLERS.update({'.gz': FileIOCSVgzPolars(), 
+                           '.csv': FileIOCSVPolars()})
+# Extension literals are not interned by the compiler, as identifiers are.
+# Interning the keys lets lookups with interned extensions match by identity.
+_FILE_HANDLERS = {sys.intern(k): v for k, v in _FILE_HANDLERS.items()}
+
+def _types_mapper(dtype_backend):
+    """Returns the to_pandas types_mapper for the dtype backend."""
+    if dtype_backend == 'pyarrow':
+        return getattr(pd, 'ArrowDtype', None)
+    return None
+
+def _temporal_as_strings(table):
+    """Casts the date and timestamp columns pyarrow inferred to strings.
+
+    The pandas parser does not infer dates, so the CSV readers return the
+    same dtypes on every path; columns in 'parse_dates' are converted
+    afterwards. Dates are formatted as 'YYYY-MM-DD', and timestamps as
+    'YYYY-MM-DD hh:mm:ss' with any fraction of a second.
+    """
+    for i, field in enumerate(table.schema):
+        if pa.types.is_date(field.type) or pa.types.is_timestamp(field.type):
+            table = table.set_column(i, field.name, 
+                                     table.column(i).cast(pa.string()))
+    return table
+
+def _read_csv(f, dtype_backend=None, **kwargs):
+    """Calls pandas.read_csv, passing 'dtype_backend' when it is supported.
+
+    'f' is a path or a binary file object.
+    """
+    if dtype_backend:
+        try:
+            return pd.read_csv(f, dtype_backend=dtype_backend, **kwargs)
+        except TypeError:
+            if hasattr(f, 'seek'):
+                f.seek(0)
+    return pd.read_csv(f, **kwargs)
+
+# Error messages for extensions already found to be unsupported
+_UNSUPPORTED_EXT = {}
+
+@functools.lru_cache(maxsize=16)
+def _get_file_handler(file_ext):
+    """Returns the file handler registered for the file extension.
+    
+    Extensions are matched without regard to case, e.g. '.CSV'. Lookups 
+    are memoized by extension, and unsupported extensions are remembered 
+    so repeat probes raise without a registry lookup. Call 
+    _clear_handler_caches() after changing _FILE_HANDLERS.
+    """
+    message = _UNSUPPORTED_EXT.get(file_ext)
+    if message is not None:
+        raise ValueError(message)
+    file_handler = _FILE_HANDLERS.get(file_ext) or \
+        _FILE_HANDLERS.get(file_ext.lower())
+    if file_handler is None:
+        message = "{ext} files are not supported.".format(
+            ext=file_ext or 'Extensionless')
+        _UNSUPPORTED_EXT[file_ext] = message
+        raise ValueError(message)        
+    return file_handler
+
+def _clear_handler_caches():
+    """Clears the handler lookup caches after _FILE_HANDLERS changes."""
+    _get_file_handler.cache_clear()
+    _UNSUPPORTED_EXT.clear()
+
+def _handler_for(path):
+    """Returns the handler for the extension of 'path'.
+    
+    Raises a ValueError if the extension is not supported.
+    """
+    handler = _lookup_handler(_FILE_HANDLERS, path)
+    if handler is None:
+        handler = _get_file_handler(_file_ext(path))
+    return handler
+
+def read_file(path, filter=None, **kwargs):
+    """Reads the file at 'path' with the handler for its extension."""
+    return _handler_for(path).read(path, filter, **kwargs)
+
+def _read_or_none(path, filter=None):
+    """Reads 'path', printing the error and returning None if unsupported."""
+    try:
+        return read_file(path, filter)
+    except ValueError as e:
+        print(e)
+        return None
+
+def read_many(paths, filter=None, max_workers=None, use_processes=False):
+    """Reads the files at 'paths' concurrently, returning a list in order.
+
+    The handlers hold no per-call state, so a single handler is shared by
+    the reads of every file with its extension. See FileGroup.read_all for
+    the parameters. Each element of the result is the file's contents, or
+    None if the read failed or the extension is not supported.
+    """
+    paths = list(paths)
+    max_workers = max_workers or os.cpu_count()
+    if use_processes:
+        executor = ProcessPoolExecutor(max_workers=max_workers, 
+                                       initializer=_init_read_worker)
+    else:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+    with executor:
+        return list(executor.map(_read_or_none, paths, 
+                                 [filter] * len(paths)))
+
+def _init_read_worker():
+    """Limits each read worker process to a single pyarrow thread."""
+    if pa is not None:
+        pa.set_cpu_count(1)
+
+def write_file(path, content, **kwargs):
+    """Writes 'content' to 'path' with the handler for its extension."""
+    return _handler_for(path).write(path, content, **kwargs)
+
+def _write_or_none(path, content):
+    """Writes 'path', printing the error and returning None if unsupported."""
+    try:
+        return write_file(path, content)
+    except ValueError as e:
+        print(e)
+        return None
+
+def write_many(items, max_workers=None):
+    """Writes (path, content) pairs concurrently, returning a list in order.
+
+    Writes run on a thread pool; the pyarrow and pandas writers release 
+    the GIL while formatting and compressing. Each element of the result 
+    is the path written, or None if the write failed.
+    """
+    items = list(items)
+    paths = [path for path, _ in items]
+    contents = [content for _, content in items]
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) \
+        as executor:
+        return list(executor.map(_write_or_none, paths, contents))
 
 # ---------------------------------------------------------------------------- #
 #                                  FILEIO                                      #     
 # ---------------------------------------------------------------------------- #
 class FileIO:
     """Context class sets IO strategy and performs IO operations ."""
-    _FILE_HANDLERS = {'.gz': FileIOCSVgz(), '.csv': FileIOCSV(),
-                      '.xlsx': FileIOExcel()}
 
     def __init__(self):
         pass
         
     def _get_file_handler(self, path):
-        file_ext = os.path.splitext(path)[1]
-        file_handler = self._FILE_HANDLERS.get(file_ext)
-        if file_handler is None:
-            raise Exception("{ext} files are not supported.".format(ext=file_ext))        
-        else:
-            return file_handler
+        return _handler_for(path)
 
-    def read(self, path, filter=None):
+    def read(self, path, filter=None, **kwargs):
         """Obtains a file handler based upon the file extension, then reads.""" 
-        file_handler = self._get_file_handler(path)
-        return file_handler.read(path, filter)
+        return read_file(path, filter, **kwargs)
 
-    def write(self, path, df):
+    def write(self, path, df, **kwargs):
         """Obtains a file handler based upon the file extension, then reads.""" 
-        file_handler = self._get_file_handler(path)
-        return file_handler.write(path, df)
\ No newline at end of file
+        return write_file(path, df, **kwargs)
+
+    def read_many(self, paths, filter=None, max_workers=None, 
+                  use_processes=False):
+        """Reads the files at 'paths' concurrently, returning a list in order."""
+        return read_many(paths, filter, max_workers, use_processes)
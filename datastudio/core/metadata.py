@@ -42,6 +42,9 @@ from abc import ABC, abstractmethod, abstractproperty
 import os
 from datetime import datetime
 from collections import OrderedDict
+import functools
+import getpass
+import hashlib
 import platform
 from pprint import pprint
 import psutil
@@ -50,12 +53,55 @@ import time
 import uuid
 
 from ..utils.format import scale_number
+
+@functools.lru_cache(maxsize=None)
+def _get_user():
+    """Returns the login name of the user, looked up once per process.
+
+    os.getlogin fails for processes without a controlling terminal, e.g. 
+    under cron or in containers, in which case getpass.getuser is used.
+    """
+    try:
+        return os.getlogin()
+    except OSError:
+        return getpass.getuser()
+
+def _make_id(id_mode='uuid', path=None):
+    """Returns an object id, random or derived from a file.
+
+    Parameters
+    ----------
+    id_mode : str
+        'uuid' for a random UUID; 'path_hash' for a 64 bit BLAKE2b hash of
+        'path'; 'content_hash' for a 64 bit BLAKE2b hash of the contents of
+        the file at 'path'. The hash modes fall back to a random UUID when
+        no path is given.
+    path : str (Optional)
+        The path of the file the object represents.
+
+    """
+    if id_mode == 'uuid' or path is None:
+        return str(uuid.uuid4())
+    h = hashlib.blake2b(digest_size=8)
+    if id_mode == 'path_hash':
+        h.update(os.fsencode(path))
+    elif id_mode == 'content_hash':
+        with open(path, 'rb', buffering=0) as f:
+            for chunk in iter(functools.partial(f.read, 1 << 20), b''):
+                h.update(chunk)
+    else:
+        raise ValueError("Invalid id_mode '{m}'. Expected 'uuid', 'path_hash' "
+                         "or 'content_hash'.".format(m=id_mode))
+    return h.hexdigest()
+
 # --------------------------------------------------------------------------- #
 #                                 Metadata                                    #
 # --------------------------------------------------------------------------- #
 class Metadata:
     """ Class containing administrative, descriptive, and tech metadata."""
 
+    __slots__ = ('_metadata',)
+
     def __init__(self):
         self._metadata = {}
 
@@ -73,6 +119,7 @@ class Metadata:
 
         Returns the administrative, descriptive, technical or process metadata 
         object based upon a partial match of the metadata_type parameter.  
+        Full type names, e.g. 'administrative', are looked up directly.
 
         Parameters
         ----------
@@ -82,9 +129,12 @@ class Metadata:
         if metadata_type is None:
             return self._metadata
         else:
-            metadata = next(v for (k, v) in self._metadata.items() if \
-                metadata_type.lower() in k.lower())
-            if metadata:
+            metadata_type = metadata_type.lower()
+            metadata = self._metadata.get(metadata_type)
+            if metadata is None:
+                metadata = next((v for (k, v) in self._metadata.items() if \
+                    metadata_type in k), None)
+            if metadata is not None:
                 return metadata
             else:
                 raise KeyError("No metadata type matching '{t}'. \
@@ -97,9 +147,7 @@ class Metadata:
 
     def print(self, metadata_type=None):
         if metadata_type:
-            metadata = next(v for (k, v) in self._metadata.items() if \
-                metadata_type.lower() in k.lower())
-            metadata.print()
+            self.get(metadata_type).print()
 
         else:            
             for v in self._metadata.values():
@@ -247,7 +295,7 @@ class MetadataRDBMSFactory(AbstractMetadataFactory):
 
     def __init__(self, entity, name, **kwargs):        
         """ Fresh creator object should contain an empty Metadata object."""
-        super(MetadataRDBMSFactory, self).__init__(entity, name, kwargs)
+        super(MetadataRDBMSFactory, self).__init__(entity, name, **kwargs)
 
     def create_admin(self):
         """Adds a administrative metadata subclass object."""
@@ -275,10 +323,11 @@ class MetadataRDBMSFactory(AbstractMetadataFactory):
 class MetadataRemoteFactory(AbstractMetadataFactory):
     """ Builds a Metadata object for DataSourceDB and DataStorageDB objects."""
 
-    def __init__(self, entity, name):        
+    def __init__(self, entity, name, **kwargs):        
         """ Fresh creator object should contain an empty Metadata object."""
         self._entity = entity
         self._name = name
+        self._addl_params = kwargs
         self._reset()
 
     def _reset(self):
@@ -317,8 +366,11 @@ class MetadataRemoteFactory(AbstractMetadataFactory):
 class AbstractMetadata(ABC):
     """ Abstract base class for adminstrative, descriptive, & tech metadata.""" 
 
+    __slots__ = ('_entity', '_name', '_metadata', 'metadata_type')
+
     def __init__(self, entity, name, **kwargs):
         self._entity = entity
+        self._name = name
         self._metadata = OrderedDict() 
 
     def update(self, event=None):
@@ -366,12 +418,14 @@ class AbstractMetadata(ABC):
 class MetadataAdmin(AbstractMetadata):
     """Abstract base class for all administrative metadata objects."""
 
+    __slots__ = ()
+
     def __init__(self, entity, name, **kwargs):
         super(MetadataAdmin, self).__init__(entity, name, **kwargs)
         self.metadata_type = 'Administrative'
 
         # Extract user datetime and object data once to avoid repeated calls.
-        user = os.getlogin()
+        user = _get_user()
         date = datetime.now()
         date_string = str(date.year) + '-' + str(date.month) + '-' + \
             str(date.day) + '_' + str(date.hour) + '-' + str(date.minute) + '-' \
@@ -379,7 +433,8 @@ class MetadataAdmin(AbstractMetadata):
         date_formatted = time.strftime("%c")
         classname = entity.__class__.__name__
         
-        self._metadata['id'] = str(uuid.uuid4())
+        self._metadata['id'] = _make_id(kwargs.get('id_mode', 'uuid'), 
+                                        kwargs.get('path'))
         self._metadata['name'] = name
         self._metadata['creator'] = user
         self._metadata['created'] = date_formatted
@@ -393,9 +448,8 @@ class MetadataAdmin(AbstractMetadata):
     def update(self, event=None):
         """Updates metadata attributes to reflect changes to object."""
         super(MetadataAdmin, self).update()
-        self._metadata['modifier'] = os.getlogin()
+        self._metadata['modifier'] = _get_user()
         self._metadata['modified'] = time.strftime("%c")
-        self._metadata['updates'] += 1
 
 # --------------------------------------------------------------------------- #
 #                          MetadataAdminFile                                  #
@@ -403,6 +457,8 @@ class MetadataAdmin(AbstractMetadata):
 class MetadataAdminFile(MetadataAdmin):        
     """Administrative metadata for DataSourceFile and DataStorageFile objects."""
 
+    __slots__ = ()
+
     def __init__(self, entity, name, **kwargs):
         super(MetadataAdminFile, self).__init__(entity, name, **kwargs)       
         path = kwargs.get('path', None)                
@@ -411,13 +467,24 @@ class MetadataAdminFile(MetadataAdmin):
             self._metadata['directory'] = os.path.dirname(path)
             self._metadata['filename'] = os.path.basename(path)
             self._metadata['fileext'] = os.path.splitext(path)[1]
-            self._metadata['file_exists'] = os.path.exists(path)
-            self._metadata['file_created'] = time.strftime("%c", \
-                time.localtime(os.path.getctime(path)))
-            self._metadata['file_last_accessed'] = time.strftime("%c", \
-                time.localtime(os.path.getatime(path)))                
-            self._metadata['file_last_modified'] = time.strftime("%c", \
-                time.localtime(os.path.getmtime(path)))                           
+            # One stat call supplies existence and all three timestamps
+            try:
+                st = os.stat(path)
+            except OSError:
+                st = None
+            self._metadata['file_exists'] = st is not None
+            self._metadata['file_created'] = self._format_time(st, 'st_ctime')
+            self._metadata['file_last_accessed'] = \
+                self._format_time(st, 'st_atime')
+            self._metadata['file_last_modified'] = \
+                self._format_time(st, 'st_mtime')
+
+    @staticmethod
+    def _format_time(st, field):
+        """Formats a timestamp from a stat result, or None if no file."""
+        if st is None:
+            return None
+        return time.strftime("%c", time.localtime(getattr(st, field)))
 
 
 # --------------------------------------------------------------------------- #
@@ -426,6 +493,8 @@ class MetadataAdminFile(MetadataAdmin):
 class MetadataAdminURL(MetadataAdmin):  
     """Metadata for remote data sources."""
 
+    __slots__ = ()
+
     _params = ['url']
 
     def __init__(self, entity, name, **kwargs):
@@ -439,6 +508,8 @@ class MetadataAdminURL(MetadataAdmin):
 class MetadataDesc(AbstractMetadata):
     """ Storage and management of descriptive metadata."""
 
+    __slots__ = ()
+
     def __init__(self, entity, name, **kwargs):
         super(MetadataDesc, self).__init__(entity, name, **kwargs)
         self.metadata_type = 'Descriptive'
@@ -456,6 +527,8 @@ class MetadataDesc(AbstractMetadata):
 class MetadataDescDataCollection(MetadataDesc):  
     """Metadata for DataCollection objects."""
 
+    __slots__ = ()
+
     def __init__(self, entity, name, **kwargs):
         super(MetadataDescDataCollection, self).__init__(entity, name, **kwargs)      
         self._reset()
@@ -485,6 +558,8 @@ class MetadataDescDataCollection(MetadataDesc):
 class MetadataTech(AbstractMetadata):
     """ Storage and management of tech metadata."""
 
+    __slots__ = ()
+
     def __init__(self, entity, name, **kwargs):
         super(MetadataTech, self).__init__(entity, name, **kwargs)
         self.metadata_type = 'Technical'
@@ -523,6 +598,8 @@ class MetadataTech(AbstractMetadata):
 class MetadataTechFile(MetadataTech):
     """ Additional metadata for DataSourceFile and DataStoreFile classes."""
 
+    __slots__ = ()
+
     def __init__(self, entity, name, **kwargs):
         super(MetadataTechFile, self).__init__(entity, name, **kwargs) 
         path = kwargs.get('path', None)        
@@ -535,6 +612,8 @@ class MetadataTechFile(MetadataTech):
 class MetadataTechRDBMS(MetadataTech):        
     """Technical metadata for RDBMS sources and storage objects."""
 
+    __slots__ = ()
+
     _params = ['database', 'user', 'password', 'host', 'port']
 
     def __init__(self, entity, name, **kwargs):
@@ -549,13 +628,15 @@ class MetadataTechRDBMS(MetadataTech):
 class MetadataProcess(AbstractMetadata):
     """ Storage and management of process metadata."""
 
+    __slots__ = ()
+
     def __init__(self, entity, name, **kwargs):
         super(MetadataProcess, self).__init__(entity, name, **kwargs)
         self.metadata_type = 'Process'      
 
         self._metadata['log'] = []
 
-        user = os.getlogin()
+        user = _get_user()
         date_formatted = time.strftime("%c")
         classname = entity.__class__.__name__        
         msg = classname + " object named '" + name + "' was instantiated " +\
@@ -564,12 +645,11 @@ class MetadataProcess(AbstractMetadata):
 
     def update(self, event=None):
         """Logs an activity update.""" 
-        user = os.getlogin()
-        date_formatted = time.strftime("%c")
-        classname = self._entity.__class__.__name__        
-        msg = 'Class : ' + classname + 'Name : ' + self._name +\
-            'Date : ' + date_formatted + 'Event : ' + event
         if event:
+            date_formatted = time.strftime("%c")
+            classname = self._entity.__class__.__name__        
+            msg = 'Class : ' + classname + 'Name : ' + self._name +\
+                'Date : ' + date_formatted + 'Event : ' + event
             self._metadata['log'].append(msg)
 
     def print(self):
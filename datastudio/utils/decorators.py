@@ -19,10 +19,12 @@
 # Copyright (c) 2020 DecisionScients                                          #
 # =========================================================================== #
 """ Decorators classes."""
+import functools
 # --------------------------------------------------------------------------- #
 #                            Validation Decorators                            #
 # --------------------------------------------------------------------------- #
 def check_num(func):        
+    @functools.wraps(func)
     def func_wrapper(self, x):
         if not isinstance(x, (int,float)):
             raise TypeError("Expected a numeric parameter but received type {t}".format(t=type(x).__name__))                    
@@ -15,46 +15,30 @@ import plotly.offline as py
 from  ml_studio.utils.misc import snake
 
 def save_fig(fig, directory, filename):
-    if os.path.exists(directory):
-        path = os.path.join(os.path.abspath(directory), filename)
-        fig.savefig(path, facecolor='w', bbox_inches=None)
-    else:
-        os.makedirs(directory)
-        path = os.path.join(os.path.abspath(directory),filename)
-        fig.savefig(path, facecolor='w', bbox_inches=None)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(os.path.abspath(directory), filename)
+    fig.savefig(path, facecolor='w', bbox_inches=None)
 
 def save_gif(ani, directory, filename, fps):
     face_edge_colors = {'facecolor': 'w', 'edgecolor': 'w'}
     path = os.path.join(os.path.abspath(directory), filename)
-    if os.path.exists(directory):
-        ani.save(path, writer='imagemagick', fps=fps, savefig_kwargs = face_edge_colors)
-    else:
-        os.makedirs(directory)                
-        ani.save(path, writer='imagemagick', fps=fps, savefig_kwargs = face_edge_colors)
+    os.makedirs(directory, exist_ok=True)
+    ani.save(path, writer='imagemagick', fps=fps, savefig_kwargs = face_edge_colors)
 
 def save_csv(df, directory, filename):
     path = os.path.join(os.path.abspath(directory), filename)
-    if os.path.exists(directory):
-        df.to_csv(path, index=False)
-    else:
-        os.makedirs(directory)                
-        df.to_csv(path, index=False)
+    os.makedirs(directory, exist_ok=True)
+    df.to_csv(path, index=False)
 
 def save_numpy(a, directory, filename):
     path = os.path.join(os.path.abspath(directory), filename)
-    if os.path.exists(directory):
-        np.save(file=path, arr=a)
-    else:
-        os.makedirs(directory)                
-        np.save(file=path, arr=a)
+    os.makedirs(directory, exist_ok=True)
+    np.save(file=path, arr=a)
 
 def save_plotly(a, directory, filename):
     path = os.path.join(os.path.abspath(directory), filename)
-    if os.path.exists(directory):
-        py.plot(a, filename=path, auto_open=False, include_mathjax='cdn')
-    else:
-        os.makedirs(directory)                
-        py.plot(a, filename=path, auto_open=False, include_mathjax='cdn')
+    os.makedirs(directory, exist_ok=True)
+    py.plot(a, filename=path, auto_open=False, include_mathjax='cdn')
 
 def get_filename(instance, fileext, element=None):
         """Creates a standard format filename for saving plots."""    
@@ -4,6 +4,14 @@
 
 from setuptools import setup, find_packages
 
+# The compiled path parsing extension is optional. Without Cython the pure
+# Python implementation in datastudio/core/file.py is used.
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(['datastudio/core/_fileio.pyx'], language_level=3)
+except ImportError:
+    ext_modules = []
+
 with open('README.rst') as readme_file:
     readme = readme_file.read()
 
@@ -19,18 +27,16 @@ test_requirements = ['pytest>=3', ]
 setup(
     author="John James",
     author_email='jjames@decisionscients.com',
-    python_requires='>=3.5',
+    python_requires='>=3.8',
     classifiers=[
         'Development Status :: 2 - Pre-Alpha',
         'Intended Audience :: Developers',
         'License :: OSI Approved :: BSD License',
         'Natural Language :: English',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
-        'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
     ],
+    ext_modules=ext_modules,
     description="Data cleaning, normalization, transformation, exploration, and exploitation.",
     install_requires=requirements,
     license="BSD license",
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Data Studio                                                       #
+# Version : 0.1.0                                                             #
+# File    : test_data.py                                                      #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/datastudio                     #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Unit tests for the data layer classes."""
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+from pytest import mark
+
+from datastudio.core import _jit
+from datastudio.core import data as data_module
+from datastudio.core.data import DataSet, DataCollection, DataStoreFile
+
+def _dataset(name, **columns):
+    ds = DataSet(name)
+    ds.dataframe = pd.DataFrame(columns)
+    return ds
+
+class DataCollectionTests:
+
+    @mark.datacollection
+    def test_datacollection_add(self):
+        ds = _dataset('listings', a=[1, 2, 3])
+        dc = DataCollection('collection', entity=ds)
+        assert dc.get_member('listings') is ds, "Member not found by name."
+        assert dc.get_member('missing') is None, "Missing member not None."
+        with pytest.raises(KeyError):
+            dc.add(ds)
+
+    @mark.datacollection
+    def test_datacollection_lock(self):
+        ds1 = _dataset('listings', a=[1, 2, 3])
+        ds2 = _dataset('reviews', a=[4, 5, 6])
+        dc = DataCollection('collection', entity=ds1)
+        dc.add(ds2)
+        dc.lock('listings')
+        assert ds1.is_locked and not ds2.is_locked, "Member lock failed."
+        dc.lock()
+        assert ds2.is_locked, "Collection lock failed."
+        dc.unlock()
+        assert not ds1.is_locked and not ds2.is_locked, "Unlock failed."
+
+    @mark.datacollection
+    def test_datacollection_remove(self):
+        ds = _dataset('listings', a=[1, 2, 3])
+        dc = DataCollection('collection', entity=ds)
+        dc.remove('dataset_listings')
+        assert dc.get_member('listings') is None, "Member not removed."
+        dc.remove('dataset_listings')
+
+    @mark.datacollection
+    def test_datacollection_shared_name(self):
+        ds = _dataset('x', a=[1, 2, 3])
+        dc = DataCollection('collection', entity=ds)
+        dc.add(DataCollection('x'))
+        dc.remove('datacollection_x')
+        assert dc.get_member('x') is ds, "Member with a shared name lost."
+        dc.remove('dataset_x')
+        assert dc.get_member('x') is None, "Removed member still found."
+
+    @mark.datacollection
+    def test_datacollection_keys(self):
+        ds1 = _dataset('listings', a=[1, 2, 3])
+        ds2 = _dataset('reviews', a=[4, 5, 6])
+        dc = DataCollection('collection', entity=ds1)
+        dc.add(ds2, name='renamed')
+        dc.add(DataCollection('nested'))
+        assert type(dc._collection) is dict, "Members not stored in a dict."
+        assert list(dc._collection) == ['dataset_listings', 'dataset_renamed',
+                                        'datacollection_nested'], \
+            "Keys not correct or not in insertion order."
+        dc.change('dataset_renamed', ds1)
+        assert dc._collection['dataset_renamed'] is ds1, "Change failed."
+        dc.copy(ds2)
+        assert dc.get_member('reviews_copy') is not None, "Copy not added."
+
+class DataCollectionFilterTests:
+
+    @mark.datacollection
+    @mark.parametrize("numba", [False, True])
+    def test_datacollection_apply_filter(self, numba, monkeypatch):
+        if numba:
+            pytest.importorskip("numba")
+        monkeypatch.setattr(_jit, '_HAS_NUMBA', numba)
+        ds1 = _dataset('listings', beds=[1, 2, 3, 4], price=[10.0, 20.0, 
+                                                           float('nan'), 40.0])
+        ds2 = _dataset('reviews', rating=[1, 2])
+        dc = DataCollection('collection', entity=ds1)
+        dc.add(ds2)
+        dc.set_filter({'beds': (2, 4), 'price': (0.0, 30.0)})
+        results = dc.apply_filter()
+        assert list(results) == ['listings'], "Members not skipped."
+        assert results['listings']['beds'].tolist() == [2], \
+            "Filtered rows not correct."
+        assert dc.check_filter({'beds': 2, 'price': 20.0}), "Check failed."
+        assert not dc.check_filter({'beds': 5, 'price': 20.0}), "Check failed."
+
+    @mark.datacollection
+    @mark.parametrize("numba", [False, True])
+    def test_datacollection_sort_data(self, numba, monkeypatch):
+        if numba:
+            pytest.importorskip("numba")
+        monkeypatch.setattr(_jit, '_HAS_NUMBA', numba)
+        dc = DataCollection('collection')
+        df = pd.DataFrame({'a': [2, 1, 2, 1], 'b': [0, 3, 1, 2],
+                           'c': ['x', None, 'y', 'w']})
+        assert dc.sort_data(df) is df, "Unsorted data not returned as is."
+        dc.set_orderby(['a', 'b'])
+        assert dc.sort_data(df).index.tolist() == [3, 1, 0, 2], \
+            "Numeric sort not correct."
+        dc.set_orderby('c')
+        expected = df.sort_values('c', kind='stable')
+        assert dc.sort_data(df).index.tolist() == expected.index.tolist(), \
+            "Sort with nulls not correct."
+
+class _Store:
+    """A DataStore stand-in recording the data saved to it."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.saved = []
+
+    def save(self, data):
+        if self.fail:
+            raise IOError("Save failed.")
+        self.saved.append(data)
+
+class WriteCombinerTests:
+
+    @mark.writecombiner
+    def test_write_combiner_failed_save(self):
+        combiner = data_module._WriteCombiner()
+        bad, good = _Store(fail=True), _Store()
+        combiner.submit(bad, 'a')
+        combiner.flush()
+        combiner.submit(bad, 'b')
+        combiner.submit(good, 'c')
+        combiner.flush()
+        assert good.saved == ['c'], "Save after a failed save was dropped."
+        assert combiner._thread.is_alive(), "Writer thread stopped."
+
+    @mark.writecombiner
+    def test_write_combiner_latest_save(self, tmp_path):
+        combiner = data_module._WriteCombiner()
+        other = DataStoreFile('other', path=str(tmp_path / "other.csv"))
+        store = DataStoreFile('x', path=str(tmp_path / "x.csv"))
+        older = pd.DataFrame({'a': ['older']})
+        newer = pd.DataFrame({'a': ['newer']})
+        # Thread A registers its queue first, then saves after thread B
+        with ThreadPoolExecutor(1) as a, ThreadPoolExecutor(1) as b:
+            a.submit(combiner.submit, other, older).result()
+            b.submit(combiner.submit, store, older).result()
+            a.submit(combiner.submit, store, newer).result()
+        combiner.flush()
+        assert pd.read_csv(store.path)['a'].tolist() == ['newer'], \
+            "An older save replaced the latest one."
+
+    @mark.writecombiner
+    def test_write_combiner_snapshot(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(data_module, 'batch_saves', True)
+        store = DataStoreFile('x', path=str(tmp_path / "x.csv"))
+        ds = DataSet('x', datastore=store)
+        ds.dataframe = pd.DataFrame({'a': [1, 2]})
+        ds.save()
+        ds.dataframe.loc[0, 'a'] = 100
+        data_module.flush_saves()
+        assert pd.read_csv(store.path)['a'].tolist() == [1, 2], \
+            "A change made after save() was written."
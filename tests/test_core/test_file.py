@@ -49,6 +49,25 @@ class FileIOTests:
         tl_read = f.read(path_list)
         assert sum([len(t) for t in tl]) == len(tl_read), "Text list read not same as text list written"
 
+    @mark.fileio
+    def test_file_txt_limit(self, tmp_path):
+        path = str(tmp_path / "text.txt")
+        f = FileIOTXT()
+        f.write(path, 'h\u00e9llo')
+        assert f.read(path, 2) == 'h\u00e9', "Limit not counted in characters."
+        assert f.read(path, 0) == '', "Zero limit not applied."
+
+    @mark.fileio
+    def test_file_io_json(self):
+        path = "./tests/test_data/test_file/test.json"
+        content = {'name': 'san_francisco', 'columns': ['id', 'bathrooms']}
+        f = FileIOJSON()
+        f.write(path, content)
+        assert os.path.exists(path), "FileIOJSON didn't write file."
+        assert f.read(path) == content, "JSON read not same as JSON written"
+        assert f.read(path, filter=['name']) == {'name': 'san_francisco'}, \
+            "JSON filter not applied"
+
     @mark.fileio
     def test_file_io_csv(self):             
         pathin = "./tests/test_data/san_francisco.csv"
@@ -58,6 +77,8 @@ class FileIOTests:
         f = FileIOCSV()        
         df = f.read(pathin)
         assert isinstance(df, pd.DataFrame), "FileIOCSV didn't return a dataframe"        
+        df2 = f.read(pathin, engine='pandas')
+        assert df2.shape == df.shape, "FileIOCSV pandas engine shape not correct."
         f.write(pathout, content=df)
         assert os.path.exists(pathout), "FileIOCSV didn't write file."
         
@@ -77,6 +98,162 @@ class FileIOTests:
         f = FileIOCSV()
         f.write(pathout2, content=df)
 
+    @mark.fileio
+    def test_file_io_parquet(self):
+        pytest.importorskip("pyarrow")
+        pathin = "./tests/test_data/san_francisco.csv"
+        pathout = "./tests/test_data/test_file/san_francisco.parquet"
+        if os.path.exists(pathout):
+            os.remove(pathout)
+        df = FileIOCSV().read(pathin)
+        f = FileIOParquet()
+        f.write(pathout, content=df)
+        assert os.path.exists(pathout), "FileIOParquet didn't write file."
+        df2 = f.read(pathout, filter=['id', 'bathrooms'])
+        assert isinstance(df2, pd.DataFrame), "FileIOParquet didn't return a dataframe"
+        assert df2.shape == (df.shape[0], 2), "Parquet read shape not correct."
+
+    @mark.fileio
+    def test_file_io_feather(self):
+        pytest.importorskip("pyarrow")
+        pathin = "./tests/test_data/san_francisco.csv"
+        pathout = "./tests/test_data/test_file/san_francisco.feather"
+        if os.path.exists(pathout):
+            os.remove(pathout)
+        df = FileIOCSV().read(pathin)
+        f = FileIOFeather()
+        f.write(pathout, content=df)
+        assert os.path.exists(pathout), "FileIOFeather didn't write file."
+        df2 = f.read(pathout, filter=['id', 'bathrooms'])
+        assert isinstance(df2, pd.DataFrame), "FileIOFeather didn't return a dataframe"
+        assert df2.shape == (df.shape[0], 2), "Feather read shape not correct."
+
+    @mark.fileio
+    def test_file_io_csv_filter_order(self):
+        pytest.importorskip("pyarrow")
+        pathin = "./tests/test_data/san_francisco.csv"
+        filter = ['id', 'bathrooms', 'city', 'beds', 'id']
+        expected = ['id', 'bathrooms', 'city', 'beds']
+        f = FileIOCSV()
+        df = f.read(pathin, filter=filter)
+        assert list(df.columns) == expected, \
+            "Filter order not kept or duplicates not removed."
+        df = f.read(pathin, filter=filter, engine='pandas')
+        assert list(df.columns) == expected, "pandas filter order not kept."
+        for chunk in f.read(pathin, filter=filter, chunksize=1000):
+            assert list(chunk.columns) == expected, \
+                "Chunk filter order not kept."
+
+    @mark.fileio
+    def test_file_io_read_many(self):
+        paths = ["./tests/test_data/san_francisco.csv", 
+                 "./tests/test_data/san_francisco.unsupported"]
+        results = FileIO().read_many(paths, filter=['id'], use_processes=True)
+        assert isinstance(results[0], pd.DataFrame), "read_many didn't read."
+        assert results[1] is None, "Unsupported path didn't return None."
+
+    @mark.fileio
+    def test_file_io_write_removed_dir(self, tmp_path):
+        df = pd.DataFrame({'a': [1, 2, 3]})
+        pathout = str(tmp_path / "out" / "data.csv")
+        FileIOCSV().write(pathout, content=df)
+        shutil.rmtree(str(tmp_path / "out"))
+        FileIOCSV().write(pathout, content=df)
+        assert os.path.exists(pathout), "Write to a removed directory failed."
+
+    @mark.fileio
+    @mark.parametrize("polars_io, io, pathin", [
+        (FileIOCSVPolars, FileIOCSV, "./tests/test_data/san_francisco.csv"),
+        (FileIOCSVgzPolars, FileIOCSVgz, "./tests/test_data/nashville.csv.gz")])
+    def test_file_io_csv_polars(self, polars_io, io, pathin):
+        pytest.importorskip("polars")
+        pytest.importorskip("pyarrow")
+        filter = ['id', 'bathrooms']
+        df = polars_io().read(pathin, filter=filter)
+        expected = io().read(pathin, filter=filter)
+        assert df.shape == expected.shape, "Polars read shape not correct."
+        assert (df.dtypes == expected.dtypes).all(), \
+            "Polars read changed the default dtypes."
+        df = polars_io().read(pathin, filter=filter, dtype_backend='pyarrow')
+        assert all(str(t).endswith('[pyarrow]') for t in df.dtypes), \
+            "Polars read ignored dtype_backend."
+
+    @mark.fileio
+    def test_file_io_csv_dates(self):
+        pathin = "./tests/test_data/nashville.csv"
+        filter = ['id', 'last_scraped', 'host_since']
+        f = FileIOCSV()
+        df = f.read(pathin, filter=filter)
+        dfs = [f.read(pathin, filter=filter, engine='pandas'),
+               pd.concat(f.read(pathin, filter=filter, chunksize=1000))]
+        for other in dfs:
+            assert (df.dtypes == other.dtypes).all(), \
+                "Dtypes differ between read paths."
+        assert isinstance(df['last_scraped'].iloc[0], str), \
+            "Date column not read as strings."
+        df = f.read(pathin, filter=filter, parse_dates=['last_scraped'])
+        assert pd.api.types.is_datetime64_any_dtype(df['last_scraped']), \
+            "parse_dates column not parsed."
+
+    @mark.fileio
+    def test_file_io_csv_chunks(self):
+        pathin = "./tests/test_data/san_francisco.csv"
+        f = FileIOCSV()
+        df = f.read(pathin, filter=['id', 'bathrooms'])
+        chunks = list(f.read(pathin, filter=['id', 'bathrooms'], chunksize=1000))
+        assert all(len(c) <= 1000 for c in chunks), "Chunk larger than chunksize."
+        assert sum(len(c) for c in chunks) == len(df), "Chunked row count not correct."
+
+    @mark.fileio
+    def test_file_io_as_table(self):
+        pa = pytest.importorskip("pyarrow")
+        pathin = "./tests/test_data/san_francisco.csv"
+        table = FileIOCSV().read(pathin, filter=['id', 'bathrooms'],
+                                 as_frame=False)
+        assert isinstance(table, pa.Table), "FileIOCSV didn't return a Table"
+        assert table.num_columns == 2, "Table column count not correct."
+
+    @mark.fileio
+    def test_file_io_csv_row_filter(self):
+        ds = pytest.importorskip("pyarrow.dataset")
+        path = "./tests/test_data/san_francisco.csv"
+        f = FileIOCSV()
+        df = f.read(path, filter=['id', 'accommodates'], 
+                    row_filter=ds.field('accommodates') > 4)
+        assert isinstance(df, pd.DataFrame), "FileIOCSV didn't return a dataframe"
+        assert df.shape[1] == 2, "Number of columns not correct."
+        assert (df['accommodates'] > 4).all(), "Row filter not applied."
+
+    @mark.fileio
+    def test_file_io_csv_hints(self):
+        path = "./tests/test_data/san_francisco.csv"
+        f = FileIOCSV()
+        df = f.read(path, filter=['id', 'room_type', 'last_scraped'],
+                    parse_dates=['last_scraped'], categories=['room_type'])
+        assert df['room_type'].dtype == 'category', "Categories not applied."
+        assert pd.api.types.is_datetime64_any_dtype(df['last_scraped']), \
+            "Dates not parsed."
+        df2 = f.read(path, filter=['id', 'accommodates'], 
+                     post_process={'accommodates': lambda a: a * 2})
+        df3 = f.read(path, filter=['id', 'accommodates'])
+        assert (df2['accommodates'] == df3['accommodates'] * 2).all(), \
+            "Post process kernel not applied."
+
+    @mark.fileio
+    def test_file_io_numpy(self, get_numpy_arrays):
+        a, b, c, d, _ = get_numpy_arrays
+        path = "./tests/test_data/test_file/array.npy"
+        path_npz = "./tests/test_data/test_file/arrays.npz"
+        f = FileIONumpy()
+        f.write(path, b)
+        assert np.array_equal(f.read(path), b), "Array read not same as array written"
+        mapped = f.read(path, mmap=True)
+        assert isinstance(mapped, np.memmap), "Array not memory mapped"
+        f.write(path_npz, {'a': a, 'c': c})
+        arrays = f.read(path_npz, filter=['c'])
+        assert list(arrays) == ['c'], "Filter not applied to .npz file"
+        assert np.array_equal(arrays['c'], c), "Array read not same as array written"
+
 class FileTests:
 
     @mark.file
@@ -97,6 +274,23 @@ class FileTests:
         assert exists is True, "File Test: Invalid exists"  
         assert filename == 'san_francisco.csv', "File Test: Invalid filename"  
         assert file_ext == '.csv', "File Test: Invalid file extension"  
+        assert f.size == os.path.getsize(path), "File Test: Invalid size"
+        assert f.mtime == os.path.getmtime(path), "File Test: Invalid mtime"
+        assert File("./tests/test_data/missing.csv").size is None, \
+            "File Test: Size of missing file not None"
+
+    @mark.file
+    def test_file_read_bytes(self):
+        path = "./tests/test_data/san_francisco.csv"
+        f = File(path=path)
+        with open(path, 'rb') as fh:
+            content = fh.read()
+        assert f.read_bytes() == content, "File Test: Invalid read_bytes"
+        assert f.read_bytes(10) == content[:10], "File Test: Invalid limit"
+        assert f.read_bytes(0) == b'', "File Test: Zero limit not applied"
+        if os.path.exists('/proc/self/status'):
+            assert File(path='/proc/self/status').read_bytes(), \
+                "File Test: Zero size file not read"
 
     @mark.file
     def test_file_copy(self):
@@ -107,6 +301,10 @@ class FileTests:
         f = File(pathfrom)
         f.copy(pathto)
         assert os.path.exists(pathto), "File Test: Copy - File didn't copy"
+        os.remove(pathto)
+        f.copy(pathto, preserve_metadata=True)
+        assert os.path.getmtime(pathto) == os.path.getmtime(pathfrom), \
+            "File Test: Copy - Metadata not preserved"
 
     @mark.file
     def test_file_move(self):
@@ -124,7 +322,8 @@ class FileTests:
         assert directory == os.path.dirname(pathto), "File Test: Move File directory not updated"
         # Test locked file
         f.lock()
-        f.move(pathfrom)
+        with pytest.raises(FileLockedError):
+            f.move(pathfrom)
         assert not os.path.exists(pathfrom), "File Test: move - Locked file moved."
         # Put the file back
         f.unlock()
@@ -140,7 +339,8 @@ class FileTests:
         # Attempt to rename locked file.
         f = File(path)
         f.lock()
-        f.rename(name)
+        with pytest.raises(FileLockedError):
+            f.rename(name)
         assert f.path == path, "Renamed locked file."
         f.unlock()
         locked = f.is_locked
@@ -150,6 +350,23 @@ class FileTests:
         assert f.path == newpath, "File not renamed"
         f.rename("san_francisco")
 
+    @mark.file
+    def test_file_to_parquet(self):
+        pytest.importorskip("pyarrow")
+        path = "./tests/test_data/test_file/san_francisco.csv"
+        pathout = "./tests/test_data/test_file/san_francisco.parquet"
+        f = File(path)
+        df = f.read(filter=['id', 'bathrooms'])
+        fp = f.to_parquet()
+        assert fp.path == pathout, "File Test: Invalid Parquet path"
+        assert fp.file_ext == '.parquet', "File Test: Invalid Parquet extension"
+        df2 = fp.read(filter=['id', 'bathrooms'])
+        assert df2.shape == df.shape, "File Test: Parquet read shape not correct"
+        ff = f.to_feather()
+        assert ff.file_ext == '.feather', "File Test: Invalid Feather extension"
+        df3 = ff.read(filter=['id', 'bathrooms'])
+        assert df3.shape == df.shape, "File Test: Feather read shape not correct"
+
     @mark.file
     def test_file_csv(self):
         path =  "./tests/test_data/test_file/san_francisco.csv"
@@ -201,3 +418,54 @@ class FileTests:
         path2 = "./tests/test_data/san_francisco.csv.gz"
         shutil.copy2(path2, path)    
 
+class FileGroupTests:
+
+    @mark.filegroup
+    def test_filegroup(self):
+        path = "./tests/test_data/san_francisco.csv"
+        fg = FileGroup("listings")
+        fg.add(File(path))
+        fg.add(File("./tests/test_data/missing.csv"))
+        assert len(fg) == 2, "FileGroup Test: File not added"
+        with pytest.raises(KeyError):
+            fg.add(File(path))
+        assert fg.get('san_francisco').path == path, "FileGroup Test: Invalid get"
+        assert fg.get('not_a_file') is None, "FileGroup Test: Get missing not None"
+        df = fg.print()
+        assert df.shape == (2, 6), "FileGroup Test: Invalid print shape"
+        assert df['Size'][0] == os.path.getsize(path), "FileGroup Test: Invalid size"
+        assert not df['Exists'][1], "FileGroup Test: Missing file exists"
+        fg.remove('missing')
+        assert len(fg) == 1, "FileGroup Test: File not removed"
+        dfs = fg.read_all(filter=['id', 'bathrooms'])
+        assert list(dfs) == ['san_francisco'], "FileGroup Test: Invalid read_all keys"
+        assert dfs['san_francisco'].shape[1] == 2, "FileGroup Test: Invalid read_all shape"
+
+    @mark.filegroup
+    def test_filegroup_add_directory(self):
+        directory = "./tests/test_data"
+        fg = FileGroup("test_data")
+        fg.add_directory(directory, file_ext='.csv')
+        filenames = sorted(e.name for e in os.scandir(directory) 
+                           if e.is_file() and e.name.lower().endswith('.csv'))
+        assert len(fg) == len(filenames), "FileGroup Test: Directory not added"
+        f = fg.get('san_francisco.csv')
+        assert f.size == os.path.getsize(f.path), "FileGroup Test: Invalid size"
+
+    @mark.filegroup
+    def test_filegroup_from_directory(self):
+        directory = "./tests/test_data"
+        fg = FileGroup.from_directory(directory, file_ext='.csv')
+        assert fg.name == 'test_data', "FileGroup Test: Invalid name"
+        f = fg.get('san_francisco.csv')
+        assert f.exists, "FileGroup Test: File doesn't exist"
+        assert f.size == os.path.getsize(f.path), "FileGroup Test: Invalid size"
+
+    @mark.filegroup
+    def test_filegroup_add_directory_case(self, tmp_path):
+        (tmp_path / "DATA.CSV").write_text("a\n1\n")
+        (tmp_path / "notes.txt").write_text("text")
+        fg = FileGroup('upper')
+        fg.add_directory(str(tmp_path), file_ext='.csv')
+        assert len(fg) == 1, "FileGroup Test: Extension case not ignored"
+        assert fg.get('DATA.CSV') is not None, "FileGroup Test: Invalid key"